@@ -1,7 +1,32 @@
-from typing import Union
+from typing import Any, Callable, Iterable, Iterator, Sequence, Union
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate
+import threading
+import weakref
+
 import AppKit
+import Quartz
+
+from .core import Image, _NSImage, _NSMakeRect, _NSCompositingOperationCopy
+
+# Released canvases are kept for reuse, for at most this many pixel sizes (least recently used first out) and this many canvases per size
+_POOLED_CANVAS_SIZES = 4
+_POOLED_CANVASES_PER_SIZE = 2
+
+_CANVAS_POOL: dict[tuple[int, int], list['AppKit.NSBitmapImageRep']] = {}
+_CANVAS_POOL_LOCK = threading.Lock()
 
-from .core import Image
+@lru_cache(maxsize=16)
+def _forced_layout(width: int, height: int, horizontal: bool) -> Callable[[int], tuple['AppKit.NSRect', ...]]:
+    # Specialize the stitch layout for one fixed image size; the closure only varies with the number of images
+    step_x, step_y = (width, 0) if horizontal else (0, height)
+    size = (width, height)
+
+    @lru_cache(maxsize=8)
+    def layout(count: int) -> tuple['AppKit.NSRect', ...]:
+        return tuple(((index * step_x, index * step_y), size) for index in range(count))
+    return layout
 
 class Composition:
     """The parent class of all composition objects.
@@ -10,10 +35,32 @@ class Composition:
 
     .. versionadded:: 0.0.1
     """
-    def __init__(self):
+    __slots__ = ("widths", "heights", "_sizes", "_rects", "_canvas_size", "_cgimage_cache", "_force_dimensions")
+
+    def __init__(self, force_dimensions: Union[tuple[int, int], None] = None):
         self.widths = []
         self.heights = []
+        self._sizes = []
+        self._rects = []
         self._canvas_size = None
+        self._cgimage_cache: dict[int, tuple['AppKit.NSImage', 'Quartz.CGImageRef']] = {}
+        self.force_dimensions = force_dimensions
+
+    @property
+    def force_dimensions(self) -> Union[tuple[int, int], None]:
+        """The dimensions to resize each image to, or None to leave the sizes unaltered.
+
+        .. versionadded:: 0.0.4
+        """
+        return self._force_dimensions
+
+    @force_dimensions.setter
+    def force_dimensions(self, force_dimensions: Union[tuple[int, int], None]):
+        if force_dimensions is not None and not isinstance(force_dimensions, tuple):
+            raise TypeError(f"Error: force_dimensions must be a tuple or None, not {type(force_dimensions)}.")
+        self._force_dimensions = force_dimensions
+        self._cgimage_cache.clear()
+        self._specialize()
 
     def compose(self, *images: Image) -> Image:
         """Composes several images into one image using this composition object's composition logic.
@@ -23,17 +70,157 @@ class Composition:
 
         .. versionadded:: 0.0.1
         """
-        canvas = AppKit.NSImage.alloc().initWithSize_(self._canvas_size)
+        self._prepare(*images)
+        canvas = self._new_canvas(self._canvas_size)
+        self._render(canvas, *images)
+        return Image(self._wrap_canvas(canvas))
+
+    @classmethod
+    def compose_many(cls, groups: Iterable[Sequence[Image]], max_workers: Union[int, None] = None, **options: Any) -> list[Image]:
+        """Composes several independent groups of images in parallel, one composition per group.
+
+        Each group is composed by a fresh instance of this class created with the provided options. Compositions draw into their own bitmap graphics contexts, so they are safe to run on background threads.
+
+        :param groups: The groups of images to compose
+        :type groups: Iterable[Sequence[Image]]
+        :param max_workers: The maximum number of threads to use, or None to use the executor's default, defaults to None
+        :type max_workers: Union[int, None], optional
+        :return: The composed images, in the same order as the groups
+        :rtype: list[Image]
+
+        :Example: Build several contact sheet rows at once
+
+        >>> from macimg.compositions import HorizontalStitch
+        >>> rows = HorizontalStitch.compose_many([images[0:5], images[5:10], images[10:15]], force_dimensions=(200, 200))
+
+        .. versionadded:: 0.0.4
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda group: cls(**options).compose(*group), groups))
+
+    @contextmanager
+    def compose_reusable(self, *images: Image) -> Iterator[Image]:
+        """Composes several images into one image drawn on a pooled canvas, returning the canvas to the pool afterwards.
+
+        The yielded image is only valid inside the ``with`` block; copy or save it there if it needs to outlive the block.
+
+        :Example: Render a sequence of frames without allocating a new canvas for each
+
+        >>> from macimg.compositions import HorizontalStitch
+        >>> stitch = HorizontalStitch(force_dimensions=(100, 100))
+        >>> for index, frame in enumerate(frames):
+        >>>     with stitch.compose_reusable(*frame) as img:
+        >>>         img.save(f"/Users/ExampleUser/Downloads/frame{index}.tiff")
+
+        .. versionadded:: 0.0.4
+        """
+        self._prepare(*images)
+        canvas, reused = self._acquire_canvas(self._canvas_size)
+        try:
+            self._render(canvas, *images, clear=reused)
+            yield Image(self._wrap_canvas(canvas))
+        finally:
+            self._release_canvas(canvas)
+
+    def _new_canvas(self, size: 'AppKit.NSSize') -> 'AppKit.NSBitmapImageRep':
+        return AppKit.NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+            None, int(size.width), int(size.height), 8, 4, True, False, AppKit.NSDeviceRGBColorSpace, 0, 0
+        )
+
+    def _wrap_canvas(self, canvas: 'AppKit.NSBitmapImageRep') -> 'AppKit.NSImage':
+        result = _NSImage.alloc().initWithSize_(canvas.size())
+        result.addRepresentation_(canvas)
+        return result
+
+    def _acquire_canvas(self, size: 'AppKit.NSSize') -> tuple['AppKit.NSBitmapImageRep', bool]:
+        # Canvases are allocated at whole-pixel sizes, so that's what the pool is keyed on
+        key = (int(size.width), int(size.height))
+        with _CANVAS_POOL_LOCK:
+            pooled = _CANVAS_POOL.pop(key, None)
+            if pooled is not None:
+                _CANVAS_POOL[key] = pooled
+                if pooled:
+                    return pooled.pop(), True
+        return self._new_canvas(size), False
+
+    def _release_canvas(self, canvas: 'AppKit.NSBitmapImageRep'):
+        key = (canvas.pixelsWide(), canvas.pixelsHigh())
+        with _CANVAS_POOL_LOCK:
+            pooled = _CANVAS_POOL.pop(key, [])
+            if len(pooled) < _POOLED_CANVASES_PER_SIZE:
+                pooled.append(canvas)
+            _CANVAS_POOL[key] = pooled
+            while len(_CANVAS_POOL) > _POOLED_CANVAS_SIZES:
+                del _CANVAS_POOL[next(iter(_CANVAS_POOL))]
+
+    @contextmanager
+    def _drawing_into(self, canvas: 'AppKit.NSBitmapImageRep'):
+        # Draw straight into the bitmap's context rather than going through NSImage.lockFocus
+        context = AppKit.NSGraphicsContext.graphicsContextWithBitmapImageRep_(canvas)
+        AppKit.NSGraphicsContext.saveGraphicsState()
+        AppKit.NSGraphicsContext.setCurrentContext_(context)
+        try:
+            yield
+            context.flushGraphics()
+        finally:
+            AppKit.NSGraphicsContext.restoreGraphicsState()
+
+    def _render(self, canvas: 'AppKit.NSBitmapImageRep', *images: Image, clear: bool = False):
+        # Resolve every input before the canvas becomes the current context, keeping loading and resampling out of the drawing section
+        resolve = self._cgimage
+        cgimages = [resolve(image) for image in images]
+
+        with self._drawing_into(canvas):
+            if clear:
+                # Wipe whatever the previous user of a pooled canvas drew
+                AppKit.NSColor.clearColor().set()
+                AppKit.NSRectFillUsingOperation(_NSMakeRect(0, 0, self._canvas_size.width, self._canvas_size.height), _NSCompositingOperationCopy)
+            self._draw_images(*cgimages)
 
-        canvas.lockFocus()
-        self._draw_images(*images)
-        canvas.unlockFocus()
+    def _cgimage(self, image: Image) -> 'Quartz.CGImageRef':
+        # Resolve (and, with forced dimensions, resample) each image once, then reuse it for as long as the image's contents are unchanged
+        key = id(image)
+        cached = self._cgimage_cache.get(key)
+        if cached is not None and cached[0] is image._nsimage:
+            return cached[1]
 
-        return Image(canvas)
+        if self.force_dimensions is None:
+            cgimage = image._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+        else:
+            width, height = self.force_dimensions
+            canvas = self._new_canvas(AppKit.NSMakeSize(width, height))
+            with self._drawing_into(canvas):
+                image._nsimage.drawInRect_(((0, 0), (width, height)))
+            cgimage = canvas.CGImage()
+
+        if cached is None:
+            weakref.finalize(image, self._cgimage_cache.pop, key, None)
+        self._cgimage_cache[key] = (image._nsimage, cgimage)
+        return cgimage
+
+    def _measure(self, *images: Image):
+        if self.force_dimensions is None:
+            self._sizes = [image.size for image in images]
+            self.widths, self.heights = map(list, zip(*self._sizes))
+        else:
+            width, height = self.force_dimensions
+            self._sizes = [self.force_dimensions] * len(images)
+            self.widths = [width] * len(images)
+            self.heights = [height] * len(images)
 
-    def _draw_images(self, *images: Image):
+    def _specialize(self):
         pass
 
+    def _prepare(self, *images: Image):
+        pass
+
+    def _draw_images(self, *cgimages: 'Quartz.CGImageRef'):
+        # Rects are laid out by subclasses before the canvas is focused, so this is the only loop that runs while drawing
+        context = AppKit.NSGraphicsContext.currentContext().CGContext()
+        for cgimage, rect in zip(cgimages, self._rects):
+            Quartz.CGContextDrawImage(context, rect, cgimage)
+
 class HorizontalStitch(Composition):
     """A composition which places images side-by-side in successive order.
 
@@ -42,33 +229,33 @@ class HorizontalStitch(Composition):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ("_fixed_layout",)
+
     def __init__(self, force_dimensions: Union[tuple[int, int], None] = None):
-        self.force_dimensions = force_dimensions
+        super().__init__(force_dimensions)
+
+    def _specialize(self):
+        self._fixed_layout = None if self.force_dimensions is None else _forced_layout(*self.force_dimensions, True)
+
+    def _prepare(self, *images: Image):
+        self._measure(*images)
 
-    def compose(self, *images: Image) -> Image:
         if self.force_dimensions is None:
-            self.widths = [image.size[0] for image in images]
-            self.heights = [image.size[1] for image in images]
-        elif isinstance(self.force_dimensions, tuple):
-            self.widths = [self.force_dimensions[0]] * len(images)
-            self.heights = [self.force_dimensions[1]] * len(images)
-
-        total_width = sum(self.widths)
-        max_height = max(self.heights)
+            total_width = sum(self.widths)
+            max_height = max(self.heights)
+        else:
+            total_width = self.force_dimensions[0] * len(images)
+            max_height = self.force_dimensions[1]
         self._canvas_size = AppKit.NSMakeSize(total_width, max_height)
-        return super().compose(*images)
-
-    def _draw_images(self, *images: Image):
-        current_x = 0
-        for image in images:
-            if self.force_dimensions is None:
-                rect = AppKit.NSMakeRect(current_x, 0, image.size[0], image.size[1])
-                current_x += image.size[0]
-            else:
-                rect = AppKit.NSMakeRect(current_x, 0, self.force_dimensions[0], self.force_dimensions[1])
-                current_x += self.force_dimensions[0]
-            
-            image._nsimage.drawInRect_(rect)
+        self._rects = self._layout_rects()
+
+    def _layout_rects(self) -> Sequence['AppKit.NSRect']:
+        # Plain ((x, y), (width, height)) tuples are accepted anywhere PyObjC expects an NSRect, without a bridged NSMakeRect call per image
+        if self._fixed_layout is not None:
+            return self._fixed_layout(len(self._sizes))
+
+        offsets = accumulate(self.widths[:-1], initial=0)
+        return [((x, 0), size) for x, size in zip(offsets, self._sizes)]
 
 class VerticalStitch(Composition):
     """A composition which places images top-to-bottom in successive order.
@@ -78,30 +265,67 @@ class VerticalStitch(Composition):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ("_fixed_layout",)
+
     def __init__(self, force_dimensions: Union[tuple[int, int], None] = None):
-        self.force_dimensions = force_dimensions
+        super().__init__(force_dimensions)
+
+    def _specialize(self):
+        self._fixed_layout = None if self.force_dimensions is None else _forced_layout(*self.force_dimensions, False)
+
+    def _prepare(self, *images: Image):
+        self._measure(*images)
 
-    def compose(self, *images: Image) -> Image:
         if self.force_dimensions is None:
-            self.widths = [image.size[0] for image in images]
-            self.heights = [image.size[1] for image in images]
-        elif isinstance(self.force_dimensions, tuple):
-            self.widths = [self.force_dimensions[0]] * len(images)
-            self.heights = [self.force_dimensions[1]] * len(images)
-
-        total_height = sum(self.heights)
-        max_width = max(self.widths)
+            total_height = sum(self.heights)
+            max_width = max(self.widths)
+        else:
+            total_height = self.force_dimensions[1] * len(images)
+            max_width = self.force_dimensions[0]
         self._canvas_size = AppKit.NSMakeSize(max_width, total_height)
-        return super().compose(*images)
-
-    def _draw_images(self, *images: Image):
-        current_y = 0
-        for image in images:
-            if self.force_dimensions is None:
-                rect = AppKit.NSMakeRect(0, current_y, image.size[0], image.size[1])
-                current_y += image.size[1]
-            else:
-                rect = AppKit.NSMakeRect(0, current_y, self.force_dimensions[0], self.force_dimensions[1])
-                current_y += self.force_dimensions[1]
-            
-            image._nsimage.drawInRect_(rect)
\ No newline at end of file
+        self._rects = self._layout_rects()
+
+    def _layout_rects(self) -> Sequence['AppKit.NSRect']:
+        if self._fixed_layout is not None:
+            return self._fixed_layout(len(self._sizes))
+
+        offsets = accumulate(self.heights[:-1], initial=0)
+        return [((0, y), size) for y, size in zip(offsets, self._sizes)]
+
+class GridStitch(Composition):
+    """A composition which places images in rows of a fixed number of columns, filling each row left-to-right and stacking rows bottom-to-top.
+
+    This produces the same layout as stitching each row with :class:`HorizontalStitch` and then stacking the rows with :class:`VerticalStitch`, but draws every image onto a single canvas.
+
+    :param columns: The number of images in each row
+    :type columns: int
+    :param force_dimensions: The dimensions to resize each image to, or None to leave the sizes unaltered, defaults to None
+    :type force_dimensions: Union[tuple[int, int], None], optional
+    :raises ValueError: If columns is less than 1
+
+    .. versionadded:: 0.0.4
+    """
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: int, force_dimensions: Union[tuple[int, int], None] = None):
+        if columns < 1:
+            raise ValueError(f"Error: GridStitch needs at least one column, not {columns}.")
+        self.columns = columns
+        super().__init__(force_dimensions)
+
+    def _prepare(self, *images: Image):
+        self._measure(*images)
+
+        starts = range(0, len(self._sizes), self.columns)
+        rows = [self._sizes[start:start + self.columns] for start in starts]
+        row_widths = [sum(self.widths[start:start + self.columns]) for start in starts]
+        row_heights = [max(self.heights[start:start + self.columns]) for start in starts]
+        self._canvas_size = AppKit.NSMakeSize(max(row_widths), sum(row_heights))
+        self._rects = self._layout_rects(rows, row_heights)
+
+    def _layout_rects(self, rows: list[list[tuple[int, int]]], row_heights: list[int]) -> Sequence['AppKit.NSRect']:
+        rects = []
+        for start, row, y in zip(range(0, len(self._sizes), self.columns), rows, accumulate(row_heights[:-1], initial=0)):
+            offsets = accumulate(self.widths[start:start + len(row) - 1], initial=0)
+            rects.extend(((x, y), size) for x, size in zip(offsets, row))
+        return rects
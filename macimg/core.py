@@ -1,136 +1,427 @@
+import colorsys
+import functools
+import hashlib
 import os
-import tempfile
-import time
+import threading
 
-from typing import Union
+from typing import Callable, Union
 
 import AppKit
 import Quartz
+import objc
+
+# Frequently used Objective-C symbols, resolved once instead of on every call
+_NSImage = AppKit.NSImage
+_NSURL = AppKit.NSURL
+_NSString = AppKit.NSString
+_NSFont = AppKit.NSFont
+_NSMakeRect = AppKit.NSMakeRect
+_NSMakeSize = AppKit.NSMakeSize
+_NSFontAttributeName = AppKit.NSFontAttributeName
+_NSForegroundColorAttributeName = AppKit.NSForegroundColorAttributeName
+_NSCIImageRep = AppKit.NSCIImageRep
+_NSBitmapImageRep = AppKit.NSBitmapImageRep
+_NSGraphicsContext = AppKit.NSGraphicsContext
+_NSCalibratedRGBColor = AppKit.NSCalibratedRGBColor
+_NSZeroRect = AppKit.NSZeroRect
+_NSZeroSize = AppKit.NSZeroSize
+_NSCompositingOperationCopy = AppKit.NSCompositingOperationCopy
+_NSCompositingOperationSourceOver = AppKit.NSCompositingOperationSourceOver
+_CIImage = Quartz.CIImage
+_CIFilter = Quartz.CIFilter
+_kCIInputImageKey = Quartz.kCIInputImageKey
+_kCIOutputImageKey = Quartz.kCIOutputImageKey
 
 workspace = None
+_ci_contexts: dict[tuple[bool, bool], 'Quartz.CIContext'] = {}
+
+def _shared_ci_context(high_precision: bool = False, software: bool = False) -> 'Quartz.CIContext':
+    # Creating a CIContext compiles shaders and allocates GPU resources, so each kind of context is created once and shared by the whole process
+    # Color management is skipped and intermediates are kept at 8 bits per channel, matching the output; filters that accumulate many samples ask for half floats instead
+    key = (high_precision, software)
+    context = _ci_contexts.get(key)
+    if context is None:
+        options = {
+            Quartz.kCIContextUseSoftwareRenderer: software,
+            Quartz.kCIContextWorkingColorSpace: None,
+            Quartz.kCIContextWorkingFormat: Quartz.kCIFormatRGBAh if high_precision else Quartz.kCIFormatRGBA8,
+        }
+
+        # Bind the context to the system GPU when the Metal bindings are installed; otherwise Core Image picks a renderer itself
+        device = None
+        if not software:
+            try:
+                import Metal
+                device = Metal.MTLCreateSystemDefaultDevice()
+            except ImportError:
+                pass
+
+        if device is not None:
+            context = Quartz.CIContext.contextWithMTLDevice_options_(device, options)
+        else:
+            context = Quartz.CIContext.contextWithOptions_(options)
+        _ci_contexts[key] = context
+    return context
+
+@functools.cache
+def _srgb_color_space() -> 'Quartz.CGColorSpaceRef':
+    return Quartz.CGColorSpaceCreateWithName(Quartz.kCGColorSpaceSRGB)
+
+@functools.cache
+def _generic_rgb_color_space() -> 'Quartz.CGColorSpaceRef':
+    # The color space of calibrated NSColor components
+    return Quartz.CGColorSpaceCreateWithName(Quartz.kCGColorSpaceGenericRGB)
+
+def _ciimage(nsimage: 'AppKit.NSImage') -> 'Quartz.CIImage':
+    # Hand Core Image the pixels the image already holds instead of encoding and decoding a TIFF
+    representations = nsimage.representations()
+    if len(representations) == 1:
+        rep = representations[0]
+        if isinstance(rep, _NSCIImageRep):
+            return rep.CIImage()
+        if isinstance(rep, _NSBitmapImageRep):
+            return _CIImage.alloc().initWithBitmapImageRep_(rep)
+    cgimage = nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+    return _CIImage.imageWithCGImage_(cgimage)
+
+# Encoders for the file extensions that save() recognizes; anything else is written as an uncompressed TIFF
+_FILE_TYPES = {
+    ".png": (AppKit.NSBitmapImageFileTypePNG, {}),
+    ".jpg": (AppKit.NSBitmapImageFileTypeJPEG, {AppKit.NSImageCompressionFactor: 0.9}),
+    ".jpeg": (AppKit.NSBitmapImageFileTypeJPEG, {AppKit.NSImageCompressionFactor: 0.9}),
+    ".gif": (AppKit.NSBitmapImageFileTypeGIF, {}),
+    ".bmp": (AppKit.NSBitmapImageFileTypeBMP, {}),
+    ".tif": (AppKit.NSBitmapImageFileTypeTIFF, {AppKit.NSImageCompressionMethod: AppKit.NSTIFFCompressionLZW}),
+    ".tiff": (AppKit.NSBitmapImageFileTypeTIFF, {AppKit.NSImageCompressionMethod: AppKit.NSTIFFCompressionLZW}),
+}
+
+@functools.cache
+def _scratch_directory() -> str:
+    # One directory per process for preview files, created on first use and left in the system temp directory so Preview can still open them after the interpreter exits
+    import tempfile
+    return tempfile.mkdtemp(prefix="macimg-")
+
+# Files on network volumes are written in chunks of this size
+_WRITE_CHUNK_SIZE = 1 << 21
+
+def _write_data(data: 'AppKit.NSData', file_path: str):
+    directory = _NSURL.fileURLWithPath_(os.path.dirname(os.path.abspath(file_path)))
+    found, is_local, _ = directory.getResourceValue_forKey_error_(None, AppKit.NSURLVolumeIsLocalKey, None)
+    if not found or is_local:
+        data.writeToFile_options_error_(file_path, AppKit.NSDataWritingAtomic, None)
+        return
+
+    # SMB and NFS mounts perform far better with a few large writes than with the many small ones a single unbuffered write turns into
+    view = memoryview(data)
+    with open(file_path, "wb", buffering=_WRITE_CHUNK_SIZE) as file:
+        for start in range(0, len(view), _WRITE_CHUNK_SIZE):
+            file.write(view[start:start + _WRITE_CHUNK_SIZE])
+
+# Bitmaps up to this many pixels are composited by drawing into a copy of their pixel buffer instead of via lockFocus,
+# and have their filters rendered on the CPU, where there is no GPU upload, command encoding, or readback to pay for
+_SMALL_BITMAP_PIXELS = 256 * 256
+
+# Filter results with more than this many pixels are rendered in square tiles of _RENDER_TILE_SIZE pixels
+_TILED_RENDER_PIXELS = 8192 * 8192
+_RENDER_TILE_SIZE = 2048
+
+def _render_tiled(context: 'Quartz.CIContext', ciimage: 'Quartz.CIImage', extent: 'Quartz.CGRect', color_space: 'Quartz.CGColorSpaceRef') -> 'Quartz.CGImageRef':
+    # Core Image only computes the region each tile needs, so its intermediates stay tile-sized instead of image-sized
+    width, height = int(extent.size.width), int(extent.size.height)
+    bitmap = Quartz.CGBitmapContextCreate(None, width, height, 8, 0, color_space, Quartz.kCGImageAlphaPremultipliedFirst | Quartz.kCGBitmapByteOrder32Little)
+    for y in range(0, height, _RENDER_TILE_SIZE):
+        for x in range(0, width, _RENDER_TILE_SIZE):
+            tile_width, tile_height = min(_RENDER_TILE_SIZE, width - x), min(_RENDER_TILE_SIZE, height - y)
+            tile = Quartz.CGRectMake(extent.origin.x + x, extent.origin.y + y, tile_width, tile_height)
+            with objc.autorelease_pool():
+                cgimage = context.createCGImage_fromRect_format_colorSpace_(ciimage, tile, Quartz.kCIFormatBGRA8, color_space)
+                Quartz.CGContextDrawImage(bitmap, Quartz.CGRectMake(x, y, tile_width, tile_height), cgimage)
+    return Quartz.CGBitmapContextCreateImage(bitmap)
+
+def _render_ciimage(ciimage: 'Quartz.CIImage', extent: 'Quartz.CGRect', color_space: Union['Quartz.CGColorSpaceRef', None] = None, high_precision: bool = False) -> 'AppKit.NSImage':
+    # The output is an explicit 8-bit BGRA bitmap tagged with the given color space (sRGB if there is none)
+    pixels = extent.size.width * extent.size.height
+    context = _shared_ci_context(high_precision, pixels <= _SMALL_BITMAP_PIXELS)
+    if color_space is None or Quartz.CGColorSpaceGetModel(color_space) != Quartz.kCGColorSpaceModelRGB:
+        # BGRA output needs an RGB color space; grayscale and CMYK sources come out as sRGB
+        color_space = _srgb_color_space()
+    if pixels > _TILED_RENDER_PIXELS:
+        cgimage = _render_tiled(context, ciimage, extent, color_space)
+    else:
+        cgimage = context.createCGImage_fromRect_format_colorSpace_(ciimage, extent, Quartz.kCIFormatBGRA8, color_space)
+    return _NSImage.alloc().initWithCGImage_size_(cgimage, _NSZeroSize)
+
+# The last few filter and transform results, keyed on the source NSImage and a signature of what was applied to it, so that repeating an identical render (such as refreshing a preview) reuses the earlier result
+_RENDER_CACHE_SIZE = 4
+_render_cache: dict[tuple, tuple['AppKit.NSImage', 'AppKit.NSImage']] = {}
+_render_cache_lock = threading.Lock()
+
+def _cached_render(source: 'AppKit.NSImage', signature: Union[tuple, None], render: Callable[[], 'AppKit.NSImage']) -> 'AppKit.NSImage':
+    # A signature of None, or one holding unhashable values, marks a render that can't be recognized again
+    key = (id(source), signature)
+    try:
+        hash(key)
+    except TypeError:
+        signature = None
+    if signature is None:
+        return render()
+
+    with _render_cache_lock:
+        entry = _render_cache.pop(key, None)
+        if entry is not None and entry[0] is source:
+            _render_cache[key] = entry
+            return entry[1]
+
+    result = render()
+    with _render_cache_lock:
+        # The entry holds the source too, so its id can't be reused by another image while the entry exists
+        _render_cache[key] = (source, result)
+        while len(_render_cache) > _RENDER_CACHE_SIZE:
+            del _render_cache[next(iter(_render_cache))]
+    return result
+
+def _calibrated_color(red: float = 0, green: float = 0, blue: float = 0, alpha: float = 1.0) -> 'AppKit.NSColor':
+    return _NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(red, green, blue, alpha)
+
+def _calibrated_copy(nscolor: 'AppKit.NSColor') -> 'AppKit.NSColor':
+    return _calibrated_color(*nscolor.getRed_green_blue_alpha_(None, None, None, None))
+
+# NSColor objects are immutable, so the named colors can be shared by every Color that wraps them. They are built on first use to keep importing the package cheap.
+@functools.cache
+def _named_colors() -> dict[str, 'AppKit.NSColor']:
+    return {
+        "red": _calibrated_color(1, 0, 0),
+        "orange": _calibrated_copy(AppKit.NSColor.orangeColor()),
+        "yellow": _calibrated_copy(AppKit.NSColor.yellowColor()),
+        "green": _calibrated_color(0, 1, 0),
+        "cyan": _calibrated_copy(AppKit.NSColor.cyanColor()),
+        "blue": _calibrated_color(0, 0, 1),
+        "magenta": _calibrated_copy(AppKit.NSColor.magentaColor()),
+        "purple": _calibrated_copy(AppKit.NSColor.purpleColor()),
+        "brown": _calibrated_copy(AppKit.NSColor.brownColor()),
+        "white": _calibrated_color(1, 1, 1),
+        "gray": _calibrated_color(0.5, 0.5, 0.5),
+        "black": _calibrated_color(0.0, 0.0, 0.0),
+        "clear": _calibrated_color(0, 0, 0, 0),
+    }
+
+def _named_color(name: str) -> 'Color':
+    color = Color.__new__(Color)
+    color._nscolor = _named_colors()[name]
+    return color
+
+# Components of the default text and background colors
+_BLACK_RGBA = (0.0, 0.0, 0.0, 1.0)
+_WHITE_RGBA = (1.0, 1.0, 1.0, 1.0)
+
+@functools.lru_cache(maxsize=64)
+def _font(constructor: str, *args) -> 'AppKit.NSFont':
+    # Fonts are immutable and shared, so each distinct (constructor, arguments) lookup only needs to reach AppKit once
+    return getattr(_NSFont, constructor)(*args)
+
+@functools.lru_cache(maxsize=64)
+def _text_attributes(font: 'AppKit.NSFont', rgba: tuple[float, float, float, float]) -> dict:
+    # The returned dictionary is shared between callers and must not be modified
+    return {
+        _NSFontAttributeName: font,
+        _NSForegroundColorAttributeName: _calibrated_color(*rgba)
+    }
+
+@functools.lru_cache(maxsize=256)
+def _attributed_text(text: str, font_size: float, rgba: tuple[float, float, float, float]) -> 'AppKit.NSAttributedString':
+    # NSAttributedString is immutable, so repeated overlays of the same styled text can share one
+    return AppKit.NSAttributedString.alloc().initWithString_attributes_(text, _text_attributes(_font("userFontOfSize_", font_size), rgba))
+
+@functools.lru_cache(maxsize=64)
+def _cicolor(rgba: tuple[float, float, float, float]) -> 'Quartz.CIColor':
+    # CIColor is immutable, so filters and generators reapplied with the same color can share one
+    return Quartz.CIColor.alloc().initWithColor_(_calibrated_color(*rgba))
+
+@functools.lru_cache(maxsize=64)
+def _civector(*values: float) -> 'Quartz.CIVector':
+    return Quartz.CIVector.vectorWithValues_count_(values, len(values))
 
 class Color:
     def __init__(self, *args):
         if len(args) == 0:
             # No color specified -- default to white
-            self._nscolor = Color.white()._nscolor
-            
+            self._nscolor = _named_colors()["white"]
+
         elif isinstance(args[0], AppKit.NSColor):
             # Create copy of non-mutable NSColor
-            self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(
-                args[0].redComponent(),
-                args[0].greenComponent(),
-                args[0].blueComponent(),
-                args[0].alphaComponent()
-            )
+            self._nscolor = _calibrated_copy(args[0])
 
         elif isinstance(args[0], Color):
-            # Create copy of another Color object
-            self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(
-                args[0]._nscolor.redComponent(),
-                args[0]._nscolor.greenComponent(),
-                args[0]._nscolor.blueComponent(),
-                args[0]._nscolor.alphaComponent()
-            )
+            # Create copy of another Color object (the wrapped NSColor is immutable, so it can be shared)
+            self._nscolor = args[0]._nscolor
 
         elif len(args) <= 4 and all([isinstance(x, int) or isinstance(x, float) for x in args]):
             # Create color from provided RGBA values
-            red = args[0] if len(args) > 0 else 0
-            green = args[1] if len(args) > 1 else 0
-            blue = args[2] if len(args) > 2 else 0
-            alpha = args[3] if len(args) == 4 else 1.0
-            self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(red, green, blue, alpha)
+            self._nscolor = _calibrated_color(*args)
+
+    @classmethod
+    def from_rgba(cls, red: float = 0, green: float = 0, blue: float = 0, alpha: float = 1.0) -> 'Color':
+        """Initializes and returns a :class:`Color` object with the specified RGBA values, each from 0.0 to 1.0.
+
+        .. versionadded:: 0.0.4
+        """
+        color = cls.__new__(cls)
+        color._nscolor = _calibrated_color(red, green, blue, alpha)
+        return color
+
+    @classmethod
+    def from_nscolor(cls, nscolor: 'AppKit.NSColor') -> 'Color':
+        """Initializes and returns a :class:`Color` object with the same RGBA values as the provided NSColor.
+
+        .. versionadded:: 0.0.4
+        """
+        color = cls.__new__(cls)
+        color._nscolor = _calibrated_copy(nscolor)
+        return color
+
+    @classmethod
+    def copy_from(cls, color: 'Color') -> 'Color':
+        """Initializes and returns a copy of another :class:`Color` object.
+
+        .. versionadded:: 0.0.4
+        """
+        # The wrapped NSColor is immutable, so the copy can share it
+        color_copy = cls.__new__(cls)
+        color_copy._nscolor = color._nscolor
+        return color_copy
+
+    @property
+    def _nscolor(self) -> 'AppKit.NSColor':
+        if self.__nscolor is None:
+            self.__nscolor = _calibrated_color(*self.__rgba)
+        return self.__nscolor
+
+    @_nscolor.setter
+    def _nscolor(self, nscolor: 'AppKit.NSColor'):
+        self.__nscolor = nscolor
+        self.__rgba = None
+
+    def _rgba(self) -> tuple[float, float, float, float]:
+        # Read all four components in one bridge call and keep them until the wrapped color changes
+        if self.__rgba is None:
+            self.__rgba = self.__nscolor.getRed_green_blue_alpha_(None, None, None, None)
+        return self.__rgba
+
+    def _set_rgba(self, red: float, green: float, blue: float, alpha: float):
+        # Defer allocating a new NSColor until something actually needs it
+        self.__rgba = (red, green, blue, alpha)
+        self.__nscolor = None
+
+    def _hsba(self) -> tuple[float, float, float, float]:
+        red, green, blue, alpha = self._rgba()
+        return (*colorsys.rgb_to_hsv(red, green, blue), alpha)
+
+    def _set_hsba(self, hue: float, saturation: float, brightness: float, alpha: float):
+        self._set_rgba(*colorsys.hsv_to_rgb(hue, saturation, brightness), alpha)
 
+    @staticmethod
     def red() -> 'Color':
         """Initializes and returns a pure red :class:`Color` object.
 
         .. versionadded:: 0.0.1
         """
-        return Color(1, 0, 0)
+        return _named_color("red")
 
+    @staticmethod
     def orange() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (1.0, 0.5, 0.0).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.orangeColor())
+        return _named_color("orange")
 
+    @staticmethod
     def yellow() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (1.0, 1.0, 0.0).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.yellowColor())
+        return _named_color("yellow")
 
+    @staticmethod
     def green() -> 'Color':
         """Initializes and returns a pure green :class:`Color` object.
 
         .. versionadded:: 0.0.1
         """
-        return Color(0, 1, 0)
+        return _named_color("green")
 
+    @staticmethod
     def cyan() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (0.0, 1.0, 1.0).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.cyanColor())
+        return _named_color("cyan")
 
+    @staticmethod
     def blue() -> 'Color':
         """Initializes and returns a pure blue :class:`Color` object.
 
         .. versionadded:: 0.0.1
         """
-        return Color(0, 0, 1)
+        return _named_color("blue")
 
+    @staticmethod
     def magenta() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (1.0, 0.0, 1.0).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.magentaColor())
+        return _named_color("magenta")
 
+    @staticmethod
     def purple() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (0.5, 0.0, 0.5).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.purpleColor())
+        return _named_color("purple")
 
+    @staticmethod
     def brown() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (0.6, 0.4, 0.2).
 
         .. versionadded:: 0.0.1
         """
-        return Color(AppKit.NSColor.brownColor())
+        return _named_color("brown")
 
+    @staticmethod
     def white() -> 'Color':
         """Initializes and returns a pure white :class:`Color` object.
 
         .. versionadded:: 0.0.1
         """
-        return Color(1, 1, 1)
+        return _named_color("white")
 
+    @staticmethod
     def gray() -> 'Color':
         """Initializes and returns an :class:`Color` object whose RGB values are (0.5, 0.5, 0.5).
 
         .. versionadded:: 0.0.1
         """
-        return Color(0.5, 0.5, 0.5)
+        return _named_color("gray")
 
+    @staticmethod
     def black() -> 'Color':
         """Initializes and returns a pure black :class:`Color` object.
 
         .. versionadded:: 0.0.1
         """
-        return Color(0.0, 0.0, 0.0)
+        return _named_color("black")
 
+    @staticmethod
     def clear() -> 'Color':
         """Initializes and returns a an :class:`Color` object whose alpha value is 0.0.
 
         .. versionadded:: 0.0.1
         """
-        return Color(0, 0, 0, 0)
+        return _named_color("clear")
 
     @property
     def hex_value(self) -> str:
@@ -138,7 +429,8 @@ class Color:
         
         .. versionadded:: 0.1.1
         """
-        return f"{hex(int(self.red_value * 255))[2:]}{hex(int(self.green_value * 255))[2:]}{hex(int(self.blue_value * 255))[2:]}".upper()
+        red, green, blue, _ = self._rgba()
+        return f"{int(red * 255):02X}{int(green * 255):02X}{int(blue * 255):02X}"
 
     @property
     def red_value(self) -> float:
@@ -146,11 +438,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.redComponent()
+        return self._rgba()[0]
 
     @red_value.setter
     def red_value(self, red_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(red_value, self.green_value, self.blue_value, self.alpha_value)
+        _, green, blue, alpha = self._rgba()
+        self._set_rgba(red_value, green, blue, alpha)
 
     @property
     def green_value(self) -> float:
@@ -158,11 +451,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.greenComponent()
+        return self._rgba()[1]
 
     @green_value.setter
     def green_value(self, green_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(self.red_value, green_value, self.blue_value, self.alpha_value)
+        red, _, blue, alpha = self._rgba()
+        self._set_rgba(red, green_value, blue, alpha)
 
     @property
     def blue_value(self) -> float:
@@ -170,11 +464,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.blueComponent()
+        return self._rgba()[2]
 
     @blue_value.setter
     def blue_value(self, blue_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(self.red_value, self.green_value, blue_value, self.alpha_value)
+        red, green, _, alpha = self._rgba()
+        self._set_rgba(red, green, blue_value, alpha)
 
     @property
     def alpha_value(self) -> float:
@@ -182,11 +477,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.alphaComponent()
+        return self._rgba()[3]
 
     @alpha_value.setter
     def alpha_value(self, alpha_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(self.red_value, self.green_value, self.blue_value, alpha_value)
+        red, green, blue, _ = self._rgba()
+        self._set_rgba(red, green, blue, alpha_value)
 
     @property
     def hue_value(self):
@@ -194,11 +490,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.hueComponent()
+        return self._hsba()[0]
 
     @hue_value.setter
     def hue_value(self, hue_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.initWithHue_saturation_brightness_alpha_(hue_value, self.saturation_value, self.brightness_value, self.alpha_value)
+        _, saturation, brightness, alpha = self._hsba()
+        self._set_hsba(hue_value, saturation, brightness, alpha)
 
     @property
     def saturation_value(self):
@@ -206,11 +503,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.saturationComponent()
+        return self._hsba()[1]
 
     @saturation_value.setter
     def saturation_value(self, saturation_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.initWithHue_saturation_brightness_alpha_(self.hue_value, saturation_value, self.brightness_value, self.alpha_value)
+        hue, _, brightness, alpha = self._hsba()
+        self._set_hsba(hue, saturation_value, brightness, alpha)
 
     @property
     def brightness_value(self):
@@ -218,11 +516,12 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        return self._nscolor.brightnessComponent()
+        return self._hsba()[2]
 
     @brightness_value.setter
     def brightness_value(self, brightness_value: float):
-        self._nscolor = AppKit.NSCalibratedRGBColor.initWithHue_saturation_brightness_alpha_(self.hue_value, self.saturation_value, brightness_value, self.alpha_value)
+        hue, saturation, _, alpha = self._hsba()
+        self._set_hsba(hue, saturation, brightness_value, alpha)
     
     def set_rgba(self, red: float, green: float, blue: float, alpha: float) -> 'Color':
         """Sets the RGBA values of the color.
@@ -240,7 +539,7 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        self._nscolor = AppKit.NSCalibratedRGBColor.alloc().initWithRed_green_blue_alpha_(red, green, blue, alpha)
+        self._set_rgba(red, green, blue, alpha)
         return self
 
     def set_hsla(self, hue: float, saturation: float, brightness: float, alpha: float) -> 'Color':
@@ -259,7 +558,7 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        self._nscolor = AppKit.NSCalibratedRGBColor.initWithHue_saturation_brightness_alpha_(hue, saturation, brightness, alpha)
+        self._set_hsba(hue, saturation, brightness, alpha)
         return self
 
     def mix_with(self, color: 'Color', fraction: int = 0.5) -> 'Color':
@@ -274,8 +573,29 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        new_color = self._nscolor.blendedColorWithFraction_ofColor_(fraction, color._nscolor)
-        return Color(new_color.redComponent(), new_color.greenComponent(), new_color.blueComponent(), new_color.alphaComponent())
+        # Interpolate the cached components directly; the NSColor is only built if something needs it
+        mixed = Color.__new__(Color)
+        mixed._set_rgba(*(value + fraction * (other - value) for value, other in zip(self._rgba(), color._rgba())))
+        return mixed
+
+    @staticmethod
+    def mix_batch(colors: list['Color'], others: list['Color'], fractions: Union[float, list[float]] = 0.5) -> list['Color']:
+        """Blends each color in a list with the corresponding color in another list.
+
+        :param colors: The colors to blend
+        :type colors: list[Color]
+        :param others: The colors to blend into each of the first colors, in the same order
+        :type others: list[Color]
+        :param fractions: The fraction of each other color to mix in, either one value for every pair or one value per pair, from 0.0 to 1.0, defaults to 0.5
+        :type fractions: Union[float, list[float]], optional
+        :return: The resulting colors after mixing
+        :rtype: list[Color]
+
+        .. versionadded:: 0.0.4
+        """
+        if isinstance(fractions, (int, float)):
+            fractions = [fractions] * len(colors)
+        return [color.mix_with(other, fraction) for color, other, fraction in zip(colors, others, fractions)]
 
     def brighten(self, fraction: float = 0.5) -> 'Color':
         """Brightens the color by mixing the specified fraction of the system white color into it.
@@ -333,14 +653,41 @@ class Color:
 
         .. versionadded:: 0.0.1
         """
-        img = AppKit.NSImage.alloc().initWithSize_(AppKit.NSMakeSize(width, height))
-        img.lockFocus()
-        self._nscolor.drawSwatchInRect_(AppKit.NSMakeRect(0, 0, width, height))
-        img.unlockFocus()
+        if self.alpha_value == 1:
+            # Solid colors don't need a graphics context -- Core Image renders the fill straight into a bitmap
+            # The shared context doesn't color-manage, so the calibrated components are tagged with their own color space rather than sRGB
+            bounds = Quartz.CGRectMake(0, 0, width, height)
+            fill = _CIImage.imageWithColor_(_cicolor(self._rgba())).imageByCroppingToRect_(bounds)
+            return Image(_render_ciimage(fill, bounds, _generic_rgb_color_space()))
+
+        img = _NSImage.alloc().initWithSize_(_NSMakeSize(width, height))
+        with objc.autorelease_pool():
+            img.lockFocus()
+            self._nscolor.drawSwatchInRect_(_NSMakeRect(0, 0, width, height))
+            img.unlockFocus()
         return Image(img)
 
     def __repr__(self):
-        return f"<{str(type(self))}r={str(self.red_value)}, g={self.green_value}, b={self.blue_value}, a={self.alpha_value}>"
+        red, green, blue, alpha = self._rgba()
+        return f"<{str(type(self))}r={str(red)}, g={green}, b={blue}, a={alpha}>"
+
+
+@functools.lru_cache(maxsize=256)
+def _text_image(text: str, font_size: int, font_name: str, font_rgba: tuple[float, float, float, float], background_rgba: tuple[float, float, float, float], inset: int) -> 'AppKit.NSImage':
+    text = _NSString.stringWithString_(text)
+    attributes = _text_attributes(_font("fontWithName_size_", font_name, font_size), font_rgba)
+    text_size = text.sizeWithAttributes_(attributes)
+
+    # Make a background to overlay the text on
+    swatch = Color.from_rgba(*background_rgba).make_swatch(text_size.width + inset * 2, text_size.height + inset * 2)
+    text_rect = _NSMakeRect(inset, inset, text_size.width, text_size.height)
+
+    # Overlay the text
+    with objc.autorelease_pool():
+        swatch._nsimage.lockFocus()
+        text.drawInRect_withAttributes_(text_rect, attributes)
+        swatch._nsimage.unlockFocus()
+    return swatch._nsimage
 
 
 class Image:
@@ -353,12 +700,16 @@ class Image:
         self.file: str = None #: The path to the image file, if one exists
         self.modified: bool = False #: Whether the image data has been modified since the object was originally created
 
+        self.__pending_filters: list['Quartz.CIFilter'] = []
+        self.__pending_signature: Union[list, None] = []
+        self.__high_precision = False
         self._nsimage = None
 
         self.__vibrance = None
         self.__gamma = None
         self.__tint = None
         self.__temperature = None
+        self.__color_balance_filter = None
         self.__white_point = None
         self.__highlight = None
         self.__shadow = None
@@ -366,76 +717,202 @@ class Image:
         self.file = image_reference
         match image_reference:
             case None:
-                self._nsimage = AppKit.NSImage.alloc().init()
+                self._nsimage = _NSImage.alloc().init()
 
             case str() as ref if "://" in ref:
-                url = AppKit.NSURL.alloc().initWithString_(ref)
-                self._nsimage = AppKit.NSImage.alloc().initWithContentsOfURL_(url)
-
-            case str() as ref if os.path.exists(ref):
-                path = AppKit.NSURL.alloc().initFileURLWithPath_(ref)
-                self._nsimage = AppKit.NSImage.alloc().initWithContentsOfURL_(path)
-
-            case str() as ref if os.path.exists(os.getcwd() + "/" + ref):
-                path = AppKit.NSURL.alloc().initFileURLWithPath_(os.path.exists(os.getcwd() + "/" + ref))
-                self._nsimage = AppKit.NSImage.alloc().initWithContentsOfURL_(path)
+                # Decoding is deferred until the image is first used
+                url = _NSURL.alloc().initWithString_(ref)
+                self.__load = functools.partial(self.__image_from_url, url)
+
+            case str() as ref if os.path.isfile(abs_path := os.path.abspath(ref)):
+                # abspath resolves relative references against the cwd without touching the disk, so this is the only stat
+                self.file = abs_path
+                path = _NSURL.alloc().initFileURLWithPath_(abs_path)
+                self.__load = functools.partial(self.__image_from_url, path)
+                # The image holds exactly the file's pixels until something is assigned or queued
+                self.__from_file = True
 
             case str() as raw_string:
                 self.file = None
-                font = AppKit.NSFont.monospacedSystemFontOfSize_weight_(15, AppKit.NSFontWeightMedium)
-                text = AppKit.NSString.alloc().initWithString_(raw_string)
-                attributes = {
-                    AppKit.NSFontAttributeName: font,
-                    AppKit.NSForegroundColorAttributeName: Color.black()._nscolor
-                }
-                text_size = text.sizeWithAttributes_(attributes)
-
-                # Make a white background to overlay the text on
-                swatch = Color.white().make_swatch(text_size.width + 20, text_size.height + 20)
-                text_rect = AppKit.NSMakeRect(10, 10, text_size.width, text_size.height)
-
-                # Overlay the text
-                swatch._nsimage.lockFocus()                        
-                text.drawInRect_withAttributes_(text_rect, attributes)
-                swatch._nsimage.unlockFocus()
-                self._nsimage = swatch._nsimage
+                self.__load = functools.partial(self.__image_from_string, raw_string)
 
             case Image() as image:
                 self.file = image.file
+                self.modified = image.modified
                 self._nsimage = image._nsimage
 
             case AppKit.NSData() as data:
                 self.file = None
-                self._nsimage = AppKit.NSImage.alloc().initWithData_(data)
+                self._nsimage = _NSImage.alloc().initWithData_(data)
 
-            case AppKit.NSImage() as image:
+            case _NSImage() as image:
                 self.file = None
                 self._nsimage = image
 
             case _:
                 raise TypeError(f"Error: Cannot initialize Image using {type(image_reference)} type.")
 
-    def __update_image(self, modified_image: 'Quartz.CIImage') -> 'Image':
-        # Crop the result to the original image size
-        cropped = modified_image.imageByCroppingToRect_(Quartz.CGRectMake(0, 0, self.size[0] * 2, self.size[1] * 2))
+    @staticmethod
+    def __image_from_url(url: 'AppKit.NSURL') -> 'AppKit.NSImage':
+        return _NSImage.alloc().initWithContentsOfURL_(url)
+
+    @staticmethod
+    def __image_from_string(raw_string: str) -> 'AppKit.NSImage':
+        font = _font("monospacedSystemFontOfSize_weight_", 15, AppKit.NSFontWeightMedium)
+        text = _NSString.stringWithString_(raw_string)
+        attributes = _text_attributes(font, _BLACK_RGBA)
+        text_size = text.sizeWithAttributes_(attributes)
+
+        # Make a white background to overlay the text on
+        swatch = Color.white().make_swatch(text_size.width + 20, text_size.height + 20)
+        text_rect = _NSMakeRect(10, 10, text_size.width, text_size.height)
+
+        # Overlay the text
+        with objc.autorelease_pool():
+            swatch._nsimage.lockFocus()
+            text.drawInRect_withAttributes_(text_rect, attributes)
+            swatch._nsimage.unlockFocus()
+        return swatch._nsimage
+
+    @property
+    def _nsimage(self) -> 'AppKit.NSImage':
+        # Apply any queued adjustments before anything reads the image
+        if self.__pending_filters:
+            self.__flush_filters()
+        return self.__loaded_nsimage()
+
+    @_nsimage.setter
+    def _nsimage(self, nsimage: 'AppKit.NSImage'):
+        # A newly assigned image replaces the old one entirely, so adjustments queued against the old one no longer apply
+        self.__load = None
+        self.__pending_filters = []
+        self.__pending_signature = []
+        self.__high_precision = False
+        self.__representations = None
+        self.__digest = None
+        self.__size = None
+        self.__pixel_size = None
+        self.__from_file = False
+        self.__nsimage = nsimage
+
+    def __loaded_nsimage(self) -> 'AppKit.NSImage':
+        # Load or render the image on first use, keeping any adjustments queued before then
+        if self.__load is not None:
+            load, self.__load = self.__load, None
+            self.__size = None
+            self.__pixel_size = None
+            self.__nsimage = load()
+        return self.__nsimage
+
+    def __queue_filter(self, filter: 'Quartz.CIFilter', signature: Union[tuple, None] = None):
+        # Adjustments are chained and rendered together the next time the image is read
+        # A filter queued without a signature can't be recognized again, so the chain's render isn't cached
+        self.__pending_filters.append(filter)
+        if signature is None:
+            self.__pending_signature = None
+        elif self.__pending_signature is not None:
+            self.__pending_signature.append(signature)
+        self.__representations = None
+        self.__digest = None
+        self.__size = None
+        self.__pixel_size = None
+        self.__from_file = False
+        self.modified = True
+
+    def __first_representation(self) -> Union['AppKit.NSImageRep', None]:
+        # Query the representations once and reuse them until the image changes
+        if self.__representations is None:
+            self.__representations = self._nsimage.representations()
+        if len(self.__representations) > 0:
+            return self.__representations[0]
+        return None
 
-        # Convert back to NSImage
-        rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-        result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-        result.addRepresentation_(rep)
+    def __sole_bitmap(self, max_pixels: Union[int, None] = None) -> Union['AppKit.NSBitmapImageRep', None]:
+        # The sole representation of the image, if it is a bitmap with no more than max_pixels pixels
+        rep = self.__first_representation()
+        if len(self.__representations) == 1 and isinstance(rep, _NSBitmapImageRep) and (max_pixels is None or rep.pixelsWide() * rep.pixelsHigh() <= max_pixels):
+            return rep
+        return None
 
-        # Update internal data
-        self._nsimage = result
+    def __draw(self, draw: Callable[[], None], bitmap: Union['AppKit.NSBitmapImageRep', None] = None):
+        # Runs draw() with the image as the current graphics context
+        # Both paths draw into a copy, so that images sharing this NSImage (including cached renders) are left untouched. Given the image's sole bitmap,
+        # the copy is of its pixel buffer, which is drawn into directly; otherwise lockFocus also sets up an offscreen context and redraws the image into it
+        if bitmap is not None:
+            canvas = bitmap.copy()
+            with objc.autorelease_pool():
+                _NSGraphicsContext.saveGraphicsState()
+                context = _NSGraphicsContext.graphicsContextWithBitmapImageRep_(canvas)
+                _NSGraphicsContext.setCurrentContext_(context)
+                draw()
+                context.flushGraphics()
+                _NSGraphicsContext.restoreGraphicsState()
+
+            result = _NSImage.alloc().initWithSize_(self._nsimage.size())
+            result.addRepresentation_(canvas)
+            self._nsimage = result
+        else:
+            canvas = self._nsimage.copy()
+            with objc.autorelease_pool():
+                canvas.lockFocus()
+                draw()
+                canvas.unlockFocus()
+            self._nsimage = canvas
+        self.modified = True
+
+    def __flush_filters(self):
+        pending, self.__pending_filters = self.__pending_filters, []
+        high_precision, self.__high_precision = self.__high_precision, False
+        signature, self.__pending_signature = self.__pending_signature, []
+
+        def render() -> 'AppKit.NSImage':
+            # The intermediate CIImages are autoreleased, so drain them here rather than letting them pile up over a batch
+            with objc.autorelease_pool():
+                source = _ciimage(nsimage)
+                image = source
+                for filter in pending:
+                    filter.setValue_forKey_(image, _kCIInputImageKey)
+                    image = filter.valueForKey_(_kCIOutputImageKey)
+
+                # Crop the result back to the source image's pixel extent, unless the adjustments left it unchanged
+                extent = source.extent()
+                if not Quartz.CGRectEqualToRect(image.extent(), extent):
+                    image = image.imageByCroppingToRect_(extent)
+
+                # Render once through the shared context, rather than wrapping the recipe in an NSCIImageRep that re-renders on every draw
+                rendered = _render_ciimage(image, extent, source.colorSpace(), high_precision)
+                # Filters don't change the image's geometry, so the result keeps the source's point size (and with it, its resolution)
+                rendered.setSize_(nsimage.size())
+                return rendered
+
+        nsimage = self.__loaded_nsimage()
+        self._nsimage = _cached_render(nsimage, None if signature is None else (high_precision, *signature), render)
         self.modified = True
-        return self
+
+    def __render(self):
+        # Render queued adjustments now, rather than the next time the image is read
+        if self.__pending_filters:
+            self.__flush_filters()
 
     @property
     def size(self) -> tuple[int, int]:
-        """The dimensions of the image, in pixels.
+        """The dimensions of the image, in points. These are the units that :func:`pad`, :func:`overlay_image`, and :func:`overlay_text` take their locations and sizes in.
+
+        For 72 dpi images, points and pixels are the same. For images at other resolutions, such as 144 dpi Retina screenshots, the pixel dimensions are the point dimensions multiplied by the resolution divided by 72.
 
         .. versionadded:: 0.0.1
         """
-        return tuple(self._nsimage.size())
+        if self.__size is None:
+            # Queued filters keep the source's dimensions, so the size is read from the source without rendering them
+            self.__size = tuple(self.__loaded_nsimage().size())
+        return self.__size
+
+    def _pixel_size(self) -> tuple[int, int]:
+        # The dimensions of the image's backing bitmap, which is the coordinate space Core Image filters work in
+        if self.__pixel_size is None:
+            cgimage = self.__loaded_nsimage().CGImageForProposedRect_context_hints_(None, None, None)[0]
+            self.__pixel_size = (0, 0) if cgimage is None else (Quartz.CGImageGetWidth(cgimage), Quartz.CGImageGetHeight(cgimage))
+        return self.__pixel_size
 
     @property
     def data(self) -> 'AppKit.NSData':
@@ -451,9 +928,9 @@ class Image:
 
         .. versionadded:: 0.0.1
         """
-        reps = self._nsimage.representations()
-        if len(reps) > 0:
-            return reps[0].hasAlpha()
+        rep = self.__first_representation()
+        if rep is not None:
+            return rep.hasAlpha()
         # TODO: Make sure this is never a false negative
         return False
 
@@ -463,9 +940,9 @@ class Image:
 
         .. versionadded:: 0.0.1
         """
-        reps = self._nsimage.representations()
-        if len(reps) > 0:
-            return reps[0].isOpaque()
+        rep = self.__first_representation()
+        if rep is not None:
+            return rep.isOpaque()
         # TODO: Make sure this is never a false negative
         return False
 
@@ -475,12 +952,81 @@ class Image:
 
         .. versionadded:: 0.0.1
         """
-        reps = self._nsimage.representations()
-        if len(reps) > 0:
-            return reps[0].colorSpaceName()
+        rep = self.__first_representation()
+        if rep is not None:
+            return rep.colorSpaceName()
         # TODO: Make sure this is never a false negative
         return None
 
+    def apply_filters(self, filters: list['Filter']) -> 'Image':
+        """Applies a sequence of filters to the image. The filters are chained together and rendered in a single pass the next time the image is used.
+
+        Filters that derive their adjustments from the image's content, like :class:`~macimg.filters.AutoEnhance`, analyze the output of the filters before them, so the filters up to that point are rendered first.
+
+        :param filters: The filters to apply, in order
+        :type filters: list[Filter]
+        :return: The image object, modifications included
+        :rtype: Image
+
+        .. versionadded:: 0.0.4
+        """
+        # Filters are configured before being queued, so that filters reading the image's size don't render a partial chain
+        # A filter that analyzes the image's content (e.g. AutoEnhance) is the exception: the filters before it are queued first, so its analysis renders and sees their output, just as when the filters are applied one at a time
+        configured = []
+        for filter in (member for filter in filters for member in filter._flattened()):
+            if filter._analyzes_content:
+                self.__queue_configured(configured)
+                configured = []
+            configured.append((filter, filter._cifilters_for(self)))
+        self.__queue_configured(configured)
+        return self
+
+    def __queue_configured(self, configured: list[tuple['Filter', list['Quartz.CIFilter']]]):
+        for filter, cifilters in configured:
+            for cifilter in cifilters:
+                self.__queue_filter(cifilter, filter._signature())
+            # The whole chain is rendered in one context, so one filter needing half-float intermediates promotes all of them
+            self.__high_precision = self.__high_precision or filter._high_precision
+
+    @classmethod
+    def apply_filters_batch(cls, images: list['Image'], filters: list['Filter'], max_workers: Union[int, None] = None) -> list['Image']:
+        """Applies the same sequence of filters to several images, rendering the images in parallel.
+
+        The filters are configured for each image on the calling thread, since a filter's parameters are shared state. Each image is handed to a thread pool to be rendered through the shared Core Image context as soon as it is configured, so rendering overlaps configuring the images that follow.
+
+        :param images: The images to apply the filters to
+        :type images: list[Image]
+        :param filters: The filters to apply to each image, in order
+        :type filters: list[Filter]
+        :param max_workers: The maximum number of threads to use, or None to use one per CPU, defaults to None
+        :type max_workers: Union[int, None], optional
+        :return: The modified images, in the same order they were provided
+        :rtype: list[Image]
+
+        :Example:
+
+        >>> from macimg.distortions import Twirl
+        >>> from macimg.filters import Sepia
+        >>> frames = Image.apply_filters_batch(frames, [Twirl(radius=150), Sepia()])
+
+        .. versionadded:: 0.0.4
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            renders = {}
+            for image in images:
+                # An image listed more than once must finish its previous render before more filters are queued on it
+                previous = renders.get(id(image))
+                if previous is not None:
+                    previous.result()
+
+                image.apply_filters(filters)
+                renders[id(image)] = executor.submit(image.__render)
+
+            for render in renders.values():
+                render.result()
+        return images
+
     @property
     def gamma(self) -> float:
         """The gamma value for the image, once it has been manually set. Otherwise, the value is None.
@@ -494,13 +1040,10 @@ class Image:
     @gamma.setter
     def gamma(self, gamma: float):
         self.__gamma = gamma
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CIGammaAdjust")
+        filter = _CIFilter.filterWithName_("CIGammaAdjust")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(gamma, "inputPower")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.__queue_filter(filter)
 
     @property
     def vibrance(self) -> Union[float, None]:
@@ -515,13 +1058,10 @@ class Image:
     @vibrance.setter
     def vibrance(self, vibrance: float = 1):
         self.__vibrance = vibrance
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CIVibrance")
+        filter = _CIFilter.filterWithName_("CIVibrance")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(vibrance, "inputAmount")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        return self.__update_image(uncropped)
+        self.__queue_filter(filter)
 
     @property
     def tint(self) -> Union[float, None]:
@@ -536,15 +1076,7 @@ class Image:
     @tint.setter
     def tint(self, tint: float):
         # -100 to 100
-        temp_and_tint = Quartz.CIVector.vectorWithX_Y_(6500, tint)
-        self.__tint = tint
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CITemperatureAndTint")
-        filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
-        filter.setValue_forKey_(temp_and_tint, "inputTargetNeutral")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.set_color_balance(tint=tint)
 
     @property
     def temperature(self) -> Union[float, None]:
@@ -559,15 +1091,39 @@ class Image:
     @temperature.setter
     def temperature(self, temperature: float):
         # 2000 to inf
-        temp_and_tint = Quartz.CIVector.vectorWithX_Y_(temperature, 0)
-        self.__temperature = temperature
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CITemperatureAndTint")
+        self.set_color_balance(temperature=temperature)
+
+    def set_color_balance(self, temperature: Union[float, None] = None, tint: Union[float, None] = None) -> 'Image':
+        """Sets the temperature and tint of the image together using a single adjustment. Values that are not provided keep their current setting.
+
+        :param temperature: The temperature to target, from 2000 upward, defaults to the current temperature (or 6500 if unset)
+        :type temperature: Union[float, None], optional
+        :param tint: The tint to target, from -100 to 100, defaults to the current tint (or 0 if unset)
+        :type tint: Union[float, None], optional
+        :return: The image object, modifications included
+        :rtype: Image
+
+        .. versionadded:: 0.0.4
+        """
+        if temperature is not None:
+            self.__temperature = temperature
+        if tint is not None:
+            self.__tint = tint
+
+        temp_and_tint = Quartz.CIVector.vectorWithX_Y_(6500 if self.__temperature is None else self.__temperature, self.__tint or 0)
+
+        # Retarget a color balance adjustment that has not been rendered yet instead of stacking a second one on top of it
+        if self.__pending_filters and self.__pending_filters[-1] is self.__color_balance_filter:
+            self.__color_balance_filter.setValue_forKey_(temp_and_tint, "inputTargetNeutral")
+            self.modified = True
+            return self
+
+        filter = _CIFilter.filterWithName_("CITemperatureAndTint")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(temp_and_tint, "inputTargetNeutral")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.__color_balance_filter = filter
+        self.__queue_filter(filter)
+        return self
 
     @property
     def white_point(self) -> Union['Color', None]:
@@ -583,13 +1139,10 @@ class Image:
     def white_point(self, white_point: Color):
         self.__white_point = white_point
         ci_white_point = Quartz.CIColor.alloc().initWithColor_(white_point._nscolor)
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CIWhitePointAdjust")
+        filter = _CIFilter.filterWithName_("CIWhitePointAdjust")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(ci_white_point, "inputColor")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.__queue_filter(filter)
 
     @property
     def highlight(self) -> float:
@@ -604,13 +1157,10 @@ class Image:
     @highlight.setter
     def highlight(self, highlight: float):
         self.__highlight = highlight
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CIHighlightShadowAdjust")
+        filter = _CIFilter.filterWithName_("CIHighlightShadowAdjust")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(highlight, "inputHighlightAmount")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.__queue_filter(filter)
 
     @property
     def shadow(self) -> float:
@@ -625,14 +1175,11 @@ class Image:
     @shadow.setter
     def shadow(self, shadow: float):
         self.__shadow = shadow
-        image = Quartz.CIImage.imageWithData_(self.data)
-        filter = Quartz.CIFilter.filterWithName_("CIHighlightShadowAdjust")
+        filter = _CIFilter.filterWithName_("CIHighlightShadowAdjust")
         filter.setDefaults()
-        filter.setValue_forKey_(image, "inputImage")
         filter.setValue_forKey_(self.__highlight or 1, "inputHighlightAmount")
         filter.setValue_forKey_(shadow, "inputShadowAmount")
-        uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
-        self.__update_image(uncropped)
+        self.__queue_filter(filter)
 
     def symbol(name: str):
         """Initializes an image from the SF symbol with the specified name, if such a symbol exists.
@@ -642,7 +1189,7 @@ class Image:
 
         .. versionadded:: 0.1.1
         """
-        img = AppKit.NSImage.imageWithSystemSymbolName_accessibilityDescription_(name, None)
+        img = _NSImage.imageWithSystemSymbolName_accessibilityDescription_(name, None)
         return Image(img)
 
     @staticmethod
@@ -666,27 +1213,13 @@ class Image:
 
         .. versionadded:: 0.0.1
         """
-        font = AppKit.NSFont.fontWithName_size_(font_name, font_size)
-        text = AppKit.NSString.alloc().initWithString_(text)
-        if font_color is None:
-            font_color = Color.black()
-        attributes = {
-            AppKit.NSFontAttributeName: font,
-            AppKit.NSForegroundColorAttributeName: font_color._nscolor
-        }
-        text_size = text.sizeWithAttributes_(attributes)
+        # Default colors are resolved straight to their components, without building Color objects
+        font_rgba = _BLACK_RGBA if font_color is None else font_color._rgba()
+        background_rgba = _WHITE_RGBA if background_color is None else background_color._rgba()
 
-        # Make a white background to overlay the text on
-        if background_color is None:
-            background_color = Color.white()
-        swatch = background_color.make_swatch(text_size.width + inset * 2, text_size.height + inset * 2)
-        text_rect = AppKit.NSMakeRect(inset, inset, text_size.width, text_size.height)
-
-        # Overlay the text
-        swatch._nsimage.lockFocus()                        
-        text.drawInRect_withAttributes_(text_rect, attributes)
-        swatch._nsimage.unlockFocus()
-        return swatch
+        # Hand out a copy so that drawing into the returned image never touches the cached one
+        nsimage = _text_image(text, font_size, font_name, font_rgba, background_rgba, inset)
+        return Image(nsimage.copy())
 
     def pad(self, horizontal_border_width: int = 50, vertical_border_width: int = 50, pad_color: Union[Color, None] = None) -> 'Image':
         """Pads the image with the specified color; adds a border around the image with the specified vertical and horizontal width.
@@ -706,14 +1239,17 @@ class Image:
             # No color provided -- use white by default
             pad_color = Color.white()
 
-        new_width = self.size[0] + horizontal_border_width * 2
-        new_height = self.size[1] + vertical_border_width * 2
-        color_swatch = pad_color.make_swatch(new_width, new_height)
+        width, height = self.size
+        color_swatch = pad_color.make_swatch(width + horizontal_border_width * 2, height + vertical_border_width * 2)
+
+        with objc.autorelease_pool():
+            color_swatch._nsimage.lockFocus()
+            bounds = _NSMakeRect(horizontal_border_width, vertical_border_width, width, height)
 
-        color_swatch._nsimage.lockFocus()
-        bounds = AppKit.NSMakeRect(horizontal_border_width, vertical_border_width, self.size[0], self.size[1])
-        self._nsimage.drawInRect_(bounds)
-        color_swatch._nsimage.unlockFocus()
+            # Opaque images can be copied straight over the border color without blending
+            operation = _NSCompositingOperationCopy if self.is_opaque else _NSCompositingOperationSourceOver
+            self._nsimage.drawInRect_fromRect_operation_fraction_(bounds, _NSZeroRect, operation, 1.0)
+            color_swatch._nsimage.unlockFocus()
         self._nsimage = color_swatch._nsimage
         self.modified = True
         return self
@@ -741,19 +1277,21 @@ class Image:
             size = image.size
         elif size == (-1, -1):
             # Use remaining width/height of background image
-            size = (self.size[0] - location[0], self.size[1] - location[1])
+            width, height = self.size
+            size = (width - location[0], height - location[1])
         elif size[0] == -1:
             # Use remaining width of background image + provided height
             size = (self.size[0] - location[0], size[1])
         elif size[1] == -1:
             # Use remaining height of background image + provided width
-            size = (size[1], self.size[1] - location[1])
+            size = (size[0], self.size[1] - location[1])
 
-        self._nsimage.lockFocus()
-        bounds = AppKit.NSMakeRect(location[0], location[1], size[0], size[1])
-        image._nsimage.drawInRect_(bounds)
-        self._nsimage.unlockFocus()
-        self.modified = True
+        bounds = _NSMakeRect(location[0], location[1], size[0], size[1])
+        # Opaque overlays can be copied straight over the background without blending
+        operation = _NSCompositingOperationCopy if image.is_opaque else _NSCompositingOperationSourceOver
+
+        overlay = image._nsimage
+        self.__draw(lambda: overlay.drawInRect_fromRect_operation_fraction_(bounds, _NSZeroRect, operation, 1.0), self.__sole_bitmap(_SMALL_BITMAP_PIXELS))
         return self
 
     def overlay_text(self, text: str, location: Union[tuple[int, int], None] = None, font_size: float = 12, font_color: Union[Color, None] = None) -> 'Image':
@@ -776,22 +1314,13 @@ class Image:
             # No location provided -- use (5, 5) by default
             location = (5, 5)
 
-        if font_color is None:
-            # No color provided -- use black by default
-            font_color = Color.black()
+        # No color provided -- use black by default
+        font_rgba = _BLACK_RGBA if font_color is None else font_color._rgba()
 
-
-        font = AppKit.NSFont.userFontOfSize_(font_size)
-        textRect = Quartz.CGRectMake(location[0], 0, self.size[0] - location[0], self.size[1] - location[1])
-        attributes = {
-            AppKit.NSFontAttributeName: font,
-            AppKit.NSForegroundColorAttributeName: font_color._nscolor
-        }
-
-        self._nsimage.lockFocus()
-        AppKit.NSString.alloc().initWithString_(str(text)).drawInRect_withAttributes_(textRect, attributes)
-        self._nsimage.unlockFocus()
-        self.modified = True
+        width, height = self.size
+        textRect = Quartz.CGRectMake(location[0], 0, width - location[0], height - location[1])
+        attributed_text = _attributed_text(str(text), font_size, font_rgba)
+        self.__draw(lambda: attributed_text.drawInRect_(textRect), self.__sole_bitmap())
         return self
 
     def extract_text(self) -> list[str]:
@@ -809,11 +1338,36 @@ class Image:
 
         .. versionadded:: 0.0.1
         """
-        # Prepare CGImage
-        ci_image = Quartz.CIImage.imageWithData_(self.data)
-        context = Quartz.CIContext.alloc().initWithOptions_(None)
-        img = context.createCGImage_fromRect_(ci_image, ci_image.extent())
+        return self.__extract_text()
+
+    @classmethod
+    def extract_text_batch(cls, images: list['Image'], max_workers: Union[int, None] = None, fast: bool = False) -> list[list[str]]:
+        """Extracts the visible text from several images in parallel.
+
+        Each image is processed by its own Vision request handler, so the requests can run on separate threads.
+
+        :param images: The images to extract text from
+        :type images: list[Image]
+        :param max_workers: The maximum number of threads to use, or None to use one per CPU, defaults to None
+        :type max_workers: Union[int, None], optional
+        :param fast: Whether to favor speed over accuracy by using Vision's fast recognition level without language correction, defaults to False
+        :type fast: bool, optional
+        :return: The extracted text strings for each image, in the same order as the images
+        :rtype: list[list[str]]
 
+        :Example:
+
+        >>> frames = [Image(path) for path in paths]
+        >>> for lines in Image.extract_text_batch(frames):
+        ...     print(lines)
+
+        .. versionadded:: 0.0.4
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(lambda image: image.__extract_text(fast), images))
+
+    def __extract_text(self, fast: bool = False) -> list[str]:
         # Handle request completion
         extracted_strings = []
         def recognize_text_handler(request, error):
@@ -825,13 +1379,30 @@ class Image:
         # Perform request and return extracted text
         import Vision
         request = Vision.VNRecognizeTextRequest.alloc().initWithCompletionHandler_(recognize_text_handler)
-        request_handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(img, None)
+        if fast:
+            request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelFast)
+            request.setUsesLanguageCorrection_(False)
+
+        if self.__from_file:
+            # Let Vision read the untouched file itself instead of decoding it here first
+            url = _NSURL.fileURLWithPath_(self.file)
+            request_handler = Vision.VNImageRequestHandler.alloc().initWithURL_options_(url, None)
+        else:
+            # Hand Vision the CGImage backing the image rather than re-rendering it from TIFF data
+            cgimage = self._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+            request_handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(cgimage, None)
         request_handler.performRequests_error_([request], None)
         return extracted_strings
 
-    def show_in_preview(self):
+    def show_in_preview(self, wait: bool = False):
         """Opens the image in preview.
 
+        Modified images are written to a scratch directory in the system's temporary directory.
+
+        :param wait: Whether to block until Preview has opened the image, defaults to False
+        :type wait: bool, optional
+        :raises ValueError: If the image has no pixel data, such as an empty image
+
         .. versionadded:: 0.0.1
         """
         global workspace
@@ -841,30 +1412,82 @@ class Image:
         if not self.modified and self.file is not None:
             workspace.openFile_withApplication_(self.file, "Preview")
         else:
-            tmp_file = tempfile.NamedTemporaryFile()
-            with open(tmp_file.name, 'wb') as f:
-                f.write(self._nsimage.TIFFRepresentation())
+            digest = self._content_digest()
+            if digest is None:
+                raise ValueError("Error: Cannot show an image that has no pixel data in Preview.")
+
+            # Previews are named after the image's content, so showing the same pixels again reuses the file that is already there
+            preview_path = os.path.join(_scratch_directory(), digest.hex()[:32] + ".png")
+            if not os.path.exists(preview_path):
+                # A PNG encodes to a fraction of the size of an uncompressed TIFF, and Preview opens it natively
+                cgimage = self._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+                data = _NSBitmapImageRep.alloc().initWithCGImage_(cgimage).representationUsingType_properties_(AppKit.NSBitmapImageFileTypePNG, None)
+                _write_data(data, preview_path)
 
             config = AppKit.NSWorkspaceOpenConfiguration.alloc().init()
             config.setActivates_(True)
 
-            img_url = AppKit.NSURL.alloc().initFileURLWithPath_(tmp_file.name)
-            preview_url = AppKit.NSURL.alloc().initFileURLWithPath_("/System/Applications/Preview.app/")
-            workspace.openURLs_withApplicationAtURL_configuration_completionHandler_([img_url], preview_url, config, None)
-            time.sleep(1)
+            img_url = _NSURL.alloc().initFileURLWithPath_(preview_path)
+            preview_url = _NSURL.alloc().initFileURLWithPath_("/System/Applications/Preview.app/")
+
+            opened = threading.Event()
+            def completion_handler(app, error):
+                opened.set()
+
+            workspace.openURLs_withApplicationAtURL_configuration_completionHandler_([img_url], preview_url, config, completion_handler)
+            if wait:
+                opened.wait()
 
     def save(self, file_path: Union[str, None] = None):
         """Saves the image to a file on the disk. Saves to the original file (if there was one) by default.
 
+        The image is encoded according to the file's extension: PNG, JPEG, GIF, BMP, and (LZW-compressed) TIFF are supported. Files with any other extension are saved as uncompressed TIFFs.
+
         :param file_path: The path at which to save the image file. Any existing file at that location will be overwritten, defaults to None
         :type file_path: Union[XAPath, str, None]
 
         .. versionadded:: 0.0.1
         """
         if file_path is None and self.file is not None:
-            file_path = self.file.path
-        fm = AppKit.NSFileManager.defaultManager()
-        fm.createFileAtPath_contents_attributes_(file_path, self._nsimage.TIFFRepresentation(), None)
+            file_path = self.file
+
+        file_type = _FILE_TYPES.get(os.path.splitext(file_path)[1].lower())
+        if file_type is None:
+            data = self._nsimage.TIFFRepresentation()
+        else:
+            # Encode straight from the backing CGImage instead of going through an intermediate TIFF
+            cgimage = self._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+            rep = _NSBitmapImageRep.alloc().initWithCGImage_(cgimage)
+            data = rep.representationUsingType_properties_(*file_type)
+        _write_data(data, file_path)
+
+    def _content_digest(self) -> Union[bytes, None]:
+        # Hash the raw pixels once and reuse the digest until the image changes; images without pixels have no digest
+        if self.__digest is None:
+            cgimage = self._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0] if self._nsimage is not None else None
+            if cgimage is None:
+                return None
+
+            width, height = Quartz.CGImageGetWidth(cgimage), Quartz.CGImageGetHeight(cgimage)
+            bits_per_pixel, bytes_per_row = Quartz.CGImageGetBitsPerPixel(cgimage), Quartz.CGImageGetBytesPerRow(cgimage)
+            pixels = memoryview(Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(cgimage)))
+
+            # The pixel layout is part of the digest, but the padding at the end of each row is not
+            digest = hashlib.blake2b(digest_size=32)
+            digest.update(b"%d,%d,%d,%d," % (width, height, bits_per_pixel, Quartz.CGImageGetBitmapInfo(cgimage)))
+            row_length = (width * bits_per_pixel + 7) // 8
+            if row_length == bytes_per_row:
+                digest.update(pixels[:row_length * height])
+            else:
+                for row in range(height):
+                    digest.update(pixels[row * bytes_per_row:row * bytes_per_row + row_length])
+            self.__digest = digest.digest()
+        return self.__digest
 
     def __eq__(self, other):
-        return isinstance(other, Image) and self._nsimage.TIFFRepresentation() == other._nsimage.TIFFRepresentation()
\ No newline at end of file
+        if not isinstance(other, Image):
+            return False
+        digest = self._content_digest()
+        return digest is not None and digest == other._content_digest()
+
+    __hash__ = None
\ No newline at end of file
@@ -1,10 +1,13 @@
+import os
+import threading
 from typing import Union
 
 import Quartz
 
-from .core import Image
-from .filters import Filter
+from .core import _kCIInputImageKey, _kCIOutputImageKey, _shared_ci_context
+from .filters import Filter, _inputs
 
+@_inputs(centered=True, inputRadius="radius", inputScale="curvature")
 class Bump(Filter):
     """A concave (inward) or convex (outward) bump distortion, centered at a specified location within an image.
 
@@ -23,17 +26,7 @@ class Bump(Filter):
         self.radius = radius
         self.curvature = curvature
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.curvature, "inputScale")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius")
 class CircleSplash(Filter):
     """A distortion created by extending the pixels at the circumference of a circle outward.
 
@@ -49,16 +42,7 @@ class CircleSplash(Filter):
         self.center = center
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputAngle="angle")
 class CircularWrap(Filter):
     """A distortion that wraps an image around a transparent circle.
 
@@ -77,17 +61,7 @@ class CircularWrap(Filter):
         self.radius = radius
         self.angle = angle
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.angle, "inputAngle")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius")
 class Hole(Filter):
     """A hole distortion centered at a specified location within an image.
 
@@ -103,16 +77,7 @@ class Hole(Filter):
         self.center = center
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputRotation="rotation")
 class LightTunnel(Filter):
     """A tunneling effect distortion created by rotating an image around a center point.
 
@@ -131,17 +96,7 @@ class LightTunnel(Filter):
         self.radius = radius
         self.rotation = rotation
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.rotation, "inputRotation")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputAngle="angle", inputScale="scale")
 class LinearBump(Filter):
     """A concave (inward) or convex (outward) distortion originating from a line.
 
@@ -163,18 +118,7 @@ class LinearBump(Filter):
         self.angle = angle
         self.scale = scale
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.angle, "inputAngle")
-        self._cifilter.setValue_forKey_(self.scale, "inputScale")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputScale="intensity")
 class Pinch(Filter):
     """An inward pinch distortion at a specified location within an image.
 
@@ -190,16 +134,7 @@ class Pinch(Filter):
         self.center = center
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.intensity, "inputScale")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputWidth="width", inputRefraction="refraction")
 class TorusLens(Filter):
     """A torus-shaped lens distortion.
 
@@ -221,18 +156,7 @@ class TorusLens(Filter):
         self.width = width
         self.refraction = refraction
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.width, "inputWidth")
-        self._cifilter.setValue_forKey_(self.refraction, "inputRefraction")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputAngle="angle")
 class Twirl(Filter):
     """A twirl distortion that rotates pixels around a specified location within an image.
 
@@ -251,17 +175,7 @@ class Twirl(Filter):
         self.radius = radius
         self.angle = angle
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.angle, "inputAngle")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputRadius="radius", inputAngle="angle")
 class Vortex(Filter):
     """A distortion that rotates pixels around a point within an image, simulating a vortex.
 
@@ -280,13 +194,15 @@ class Vortex(Filter):
         self.radius = radius
         self.angle = angle
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.angle, "inputAngle")
-        return super().apply_to(image)
+def _prewarm():
+    # Render a tiny image through each distortion so that its kernel is compiled before the first real image needs it
+    context = _shared_ci_context()
+    extent = Quartz.CGRectMake(0, 0, 16, 16)
+    source = Quartz.CIImage.imageWithColor_(Quartz.CIColor.blackColor()).imageByCroppingToRect_(extent)
+    for distortion in (Bump, CircleSplash, CircularWrap, Hole, LightTunnel, LinearBump, Pinch, TorusLens, Twirl, Vortex):
+        for cifilter in distortion(center=(8, 8))._cifilters_for(None):
+            cifilter.setValue_forKey_(source, _kCIInputImageKey)
+            context.createCGImage_fromRect_(cifilter.valueForKey_(_kCIOutputImageKey), extent)
+
+if os.environ.get("MACIMG_PREWARM") == "1":
+    threading.Thread(target=_prewarm, name="macimg-prewarm", daemon=True).start()
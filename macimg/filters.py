@@ -1,16 +1,72 @@
-from typing import Union
+import operator
+from typing import Sequence, Union
 
 import AppKit
 import Quartz
 
-from .core import Color, Image
+from .core import Color, Image, _NSString, _ciimage, _cicolor, _civector
+
+# One configured CIFilter per filter name; new filters copy these instead of going through the filter registry again
+_PROTOTYPES: dict[str, 'Quartz.CIFilter'] = {}
+
+def _prototype(filter_name: str) -> 'Quartz.CIFilter':
+    prototype = _PROTOTYPES.get(filter_name)
+    if prototype is None:
+        prototype = Quartz.CIFilter.filterWithName_(filter_name)
+        prototype.setDefaults()
+        _PROTOTYPES[filter_name] = prototype
+    return prototype
+
+class _Center:
+    """The center point of a filter's effect. Assigning a new center discards the CIVector cached for the previous one."""
+    def __get__(self, filter: 'Filter', owner: type = None):
+        if filter is None:
+            return self
+        return filter.__dict__.get("_center_point")
+
+    def __set__(self, filter: 'Filter', center: Union[tuple[int, int], None]):
+        filter._center_point = center
+        filter._center = None
+
+def _inputs(centered: bool = False, **inputs: str):
+    """Generates a filter's ``_prepare`` from a mapping of Core Image input keys to the attributes holding their values. Centered filters also get a ``center`` attribute, and ``inputCenter`` is set from it."""
+    # The keys are converted to NSStrings once, here, rather than on every application
+    keys = tuple(_NSString.stringWithString_(key) for key in inputs)
+    values = operator.attrgetter(*inputs.values())
+    if len(inputs) == 1:
+        # attrgetter returns a bare value rather than a tuple for a single attribute
+        single = values
+        values = lambda filter: (single(filter),)
+
+    if centered:
+        center_key = _NSString.stringWithString_("inputCenter")
+
+        def _prepare(self, image: Image):
+            parameters = dict(zip(keys, values(self)))
+            parameters[center_key] = self._center_vector(image)
+            self._set_parameters(parameters)
+    else:
+        def _prepare(self, image: Image):
+            self._set_parameters(dict(zip(keys, values(self))))
+
+    def decorate(cls: type) -> type:
+        if centered:
+            cls.center = _Center()
+        cls._prepare = _prepare
+        return cls
+    return decorate
 
 class Filter:
+    # Whether the filter needs half-float intermediates; most filters render at 8 bits per channel, like their output
+    _high_precision = False
+    # Whether the filter's parameters are derived from the image's pixels, so that it must see the output of the filters before it
+    _analyzes_content = False
+
     def __init__(self, filter_name):
-        self._size = None
-        self._bounds = None
-        self._cifilter = Quartz.CIFilter.filterWithName_(filter_name)
-        self._cifilter.setDefaults()
+        self._cifilter = _prototype(filter_name).copy()
+        self._center = None
+        self._center_size = None
+        self._parameters = None
 
     def apply_to(self, image: Image) -> Image:
         """Applies the filter to an image.
@@ -22,25 +78,62 @@ class Filter:
 
         .. versionadded:: 0.0.1
         """
-        if self._bounds is None:
-            self._bounds = AppKit.NSMakeRect(0, 0, image.size[0], image.size[1])
-
-        ciimage = Quartz.CIImage.imageWithData_(image.data)
-        self._cifilter.setValue_forKey_(ciimage, "inputImage")
-
-        uncropped =  self._cifilter.valueForKey_(Quartz.kCIOutputImageKey)
+        return image.apply_filters([self])
 
-        # Crop the result to the original image size
-        cropped = uncropped.imageByCroppingToRect_(self._bounds)
+    def apply_to_batch(self, images: list[Image], max_workers: Union[int, None] = None) -> list[Image]:
+        """Applies the filter to several images, rendering them in parallel through the shared Core Image context.
 
-        # Convert back to NSImage
-        rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-        result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-        result.addRepresentation_(rep)
+        :param images: The images to apply the filter to
+        :type images: list[Image]
+        :param max_workers: The maximum number of threads to use, or None to use one per CPU, defaults to None
+        :type max_workers: Union[int, None], optional
+        :return: The modified images, in the same order they were provided
+        :rtype: list[Image]
 
-        image._nsimage = Image(result)._nsimage
-        image.modified = True
-        return image
+        .. versionadded:: 0.0.4
+        """
+        return Image.apply_filters_batch(images, [self], max_workers)
+
+    def _prepare(self, image: Image):
+        # Subclasses set the filter's parameters for the given image here
+        pass
+
+    def _set_parameters(self, parameters: dict):
+        # Assign every input in one bridge call, and skip it entirely if nothing changed since the last application
+        if parameters != self._parameters:
+            self._cifilter.setValuesForKeysWithDictionary_(parameters)
+            self._parameters = parameters
+
+    def _center_vector(self, image: Image) -> 'Quartz.CIVector':
+        # An explicit center is boxed once, until a new one is assigned; the default center only changes with the image size
+        center = self.center
+        if center is not None:
+            if self._center is None:
+                self._center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
+            return self._center
+
+        size = image._pixel_size()
+        if self._center is None or size != self._center_size:
+            self._center = Quartz.CIVector.vectorWithX_Y_(size[0] / 2, size[1] / 2)
+            self._center_size = size
+        return self._center
+
+    def _signature(self) -> Union[tuple, None]:
+        # Identifies the effect of the filter as last prepared, so that an identical render can be recognized; None if that can't be told
+        if self._parameters is None and type(self)._prepare is not Filter._prepare:
+            # The filter set its inputs some other way than _set_parameters
+            return None
+        parameters = None if self._parameters is None else tuple(self._parameters.items())
+        return (type(self), parameters)
+
+    def _flattened(self) -> list['Filter']:
+        # The individual filters applied by this one, in order
+        return [self]
+
+    def _cifilters_for(self, image: Image) -> list['Quartz.CIFilter']:
+        self._prepare(image)
+        # Hand out a snapshot so that later parameter changes don't affect images that haven't been rendered yet
+        return [self._cifilter.copy()]
 
 class AutoEnhance(Filter):
     """Attempts to enhance the image by applying suggested filters.
@@ -54,33 +147,33 @@ class AutoEnhance(Filter):
 
     .. versionadded:: 0.0.1
     """
+    _analyzes_content = True
+
     def __init__(self, correct_red_eye: bool = False, crop_to_features: bool = False, correct_rotation: bool = False):
         self.correct_red_eye = correct_red_eye
         self.crop_to_features = crop_to_features
         self.correct_rotation = correct_rotation
 
     def apply_to(self, image: Image) -> Image:
-        ciimage = Quartz.CIImage.imageWithData_(image.data)
+        return Image(image).apply_filters([self])
+
+    def apply_to_batch(self, images: list[Image], max_workers: Union[int, None] = None) -> list[Image]:
+        # Like apply_to, this leaves the provided images untouched and returns enhanced copies
+        return Image.apply_filters_batch([Image(image) for image in images], [self], max_workers)
+
+    def _signature(self) -> tuple:
+        return (type(self), self.correct_red_eye, self.crop_to_features, self.correct_rotation)
+
+    def _cifilters_for(self, image: Image) -> list['Quartz.CIFilter']:
+        ciimage = _ciimage(image._nsimage)
         options = {
             Quartz.kCIImageAutoAdjustRedEye: self.correct_red_eye,
             Quartz.kCIImageAutoAdjustCrop: self.crop_to_features,
             Quartz.kCIImageAutoAdjustLevel: self.correct_rotation
         }
-        enhancements = ciimage.autoAdjustmentFiltersWithOptions_(options)
-
-        for filter in enhancements:
-            filter.setValue_forKey_(ciimage, "inputImage")
-            ciimage = filter.outputImage()
-
-        # Crop the result to the original image size
-        cropped = ciimage.imageByCroppingToRect_(Quartz.CGRectMake(0, 0, image.size[0] * 2, image.size[1] * 2))
-
-        # Convert back to NSImage
-        rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-        result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-        result.addRepresentation_(rep)
-        return Image(result)
+        return list(ciimage.autoAdjustmentFiltersWithOptions_(options))
 
+@_inputs(inputIntensity="intensity")
 class Bloom(Filter):
     """Applies a bloom effect to the image. Softens edges and adds a glow.
 
@@ -89,14 +182,13 @@ class Bloom(Filter):
 
     .. versionadded:: 0.0.1
     """
+    _high_precision = True
+
     def __init__(self, intensity: float = 0.5):
         super().__init__("CIBloom")
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
-
+@_inputs(inputRadius="radius", inputRingAmount="ring_amount", inputRingSize="ring_size", inputSoftness="softness")
 class BokehBlur(Filter):
     """Applies a bokeh effect to the image.
 
@@ -118,13 +210,7 @@ class BokehBlur(Filter):
         self.ring_size = ring_size
         self.softness = softness
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.ring_amount, "inputRingAmount")
-        self._cifilter.setValue_forKey_(self.ring_size, "inputRingSize")
-        self._cifilter.setValue_forKey_(self.softness, "inputSoftness")
-        return super().apply_to(image)
-
+@_inputs(inputRadius="radius")
 class BoxBlur(Filter):
     """A blur effect that uses a box-shaped convolution kernel.
 
@@ -137,10 +223,6 @@ class BoxBlur(Filter):
         super().__init__("CIBoxBlur")
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
 class Chrome(Filter):
     """A "Chrome" style effect filter.
 
@@ -157,22 +239,68 @@ class Comic(Filter):
     def __init__(self):
         super().__init__("CIComicEffect")
 
+@_inputs(inputWeights="_weights", inputBias="bias")
 class Convolution(Filter):
-    """Applies a bloom effect to the image. Softens edges and adds a glow.
+    """Convolves the image with a kernel of weights.
 
-    :param intensity: The strength of the softening and glow effects, defaults to 0.5
-    :type intensity: float
+    The kernel can be 3x3, 5x5, 7x7, a single row of 9 weights, or a single column of 9 weights. Any two-dimensional sequence of numbers works, including NumPy arrays.
+
+    :param weights: The kernel's weights, as a sequence of rows
+    :type weights: Sequence[Sequence[float]]
+    :param bias: A value added to each channel of every output pixel, defaults to 0.0
+    :type bias: float, optional
+    :raises ValueError: If the kernel's dimensions are not supported
+
+    :Example: Sharpen an image
+
+    >>> from macimg.filters import Convolution
+    >>> Convolution([[0, -1, 0], [-1, 5, -1], [0, -1, 0]]).apply_to(image)
 
     .. versionadded:: 0.0.1
     """
-    def __init__(self, matrix_dimensions: tuple[int, int]):
-        super().__init__("CIBloom")
-        self.intensity = intensity
-
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
+    _FILTER_NAMES = {
+        (3, 3): "CIConvolution3X3",
+        (5, 5): "CIConvolution5X5",
+        (7, 7): "CIConvolution7X7",
+        (1, 9): "CIConvolution9Horizontal",
+        (9, 1): "CIConvolution9Vertical",
+    }
+
+    def __init__(self, weights: Sequence[Sequence[float]], bias: float = 0.0):
+        rows, dimensions = self._kernel(weights)
+        super().__init__(self._FILTER_NAMES[dimensions])
+        self._dimensions = dimensions
+        self.weights = rows
+        self.bias = bias
+
+    @property
+    def weights(self) -> tuple[tuple[float, ...], ...]:
+        """The kernel's weights, as a tuple of rows. Assigning new weights, including ones of different dimensions, takes effect the next time the filter is applied.
 
+        .. versionadded:: 0.0.1
+        """
+        return self._rows
+
+    @weights.setter
+    def weights(self, weights: Sequence[Sequence[float]]):
+        rows, dimensions = self._kernel(weights)
+        if dimensions != self._dimensions:
+            self._cifilter = _prototype(self._FILTER_NAMES[dimensions]).copy()
+            self._parameters = None
+            self._dimensions = dimensions
+        self._rows = rows
+        # The weights are handed to Core Image as a single vector, shared by every kernel with the same weights
+        self._weights = _civector(*(weight for row in rows for weight in row))
+
+    @classmethod
+    def _kernel(cls, weights: Sequence[Sequence[float]]) -> tuple[tuple[tuple[float, ...], ...], tuple[int, int]]:
+        rows = tuple(tuple(float(weight) for weight in row) for row in weights)
+        dimensions = (len(rows), len(rows[0]) if rows else 0)
+        if dimensions not in cls._FILTER_NAMES or any(len(row) != dimensions[1] for row in rows):
+            raise ValueError(f"Error: Convolution kernels must be 3x3, 5x5, 7x7, 1x9, or 9x1, not {dimensions[0]}x{dimensions[1]}.")
+        return rows, dimensions
+
+@_inputs(inputRadius="crystal_size")
 class Crystallize(Filter):
     """Applies a crystallization filter to the image. Creates polygon-shaped color blocks by aggregating pixel values.
 
@@ -185,10 +313,6 @@ class Crystallize(Filter):
         super().__init__("CICrystallize")
         self.crystal_size = crystal_size
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.crystal_size, "inputRadius")
-        return super().apply_to(image)
-
 class DepthOfField(Filter):
     """Applies a depth of field filter to the image, simulating a tilt & shift effect.
 
@@ -201,28 +325,37 @@ class DepthOfField(Filter):
 
     .. versionadded:: 0.0.1
     """
+    _high_precision = True
+
     def __init__(self, focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None] = None, intensity: float = 100.0, focal_region_saturation: float = 1.5):
         super().__init__("CIDepthOfField")
         self.focal_region = focal_region
         self.intensity = intensity
         self.focal_region_saturation = focal_region_saturation
-
-    def apply_to(self, image: Image) -> Image:        
-        if self.focal_region is None:
-            center_top = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 3, image.size[1] / 2)
-            center_bottom = Quartz.CIVector.vectorWithX_Y_(image.size[0] * 3 / 2, image.size[1] / 2)
-            self.focal_region = (center_top, center_bottom)
-        elif isinstance(self.focal_region, tuple):
-            point1 = Quartz.CIVector.vectorWithX_Y_(self.focal_region[0])
-            point2 = Quartz.CIVector.vectorWithX_Y_(self.focal_region[1])
-            self.focal_region = (point1, point2)
-
-        self._cifilter.setValue_forKey_(self.focal_region[0], "inputPoint0")
-        self._cifilter.setValue_forKey_(self.focal_region[1], "inputPoint1")
-        self._cifilter.setValue_forKey_(self.intensity, "inputRadius")
-        self._cifilter.setValue_forKey_(self.focal_region_saturation, "inputSaturation")
-        return super().apply_to(image)
-
+        self._focal_key = None
+        self._focal_points = None
+
+    def _prepare(self, image: Image):
+        # Only rebuild the focal points when the region, or the image size for the default region, changes
+        key = (self.focal_region, None) if self.focal_region is not None else (None, image._pixel_size())
+        if key != self._focal_key:
+            if self.focal_region is None:
+                width, height = key[1]
+                # The default region runs across the middle third of the image
+                points = ((width / 3, height / 2), (width * 2 / 3, height / 2))
+            else:
+                points = self.focal_region
+            self._focal_points = tuple(_civector(x, y) for x, y in points)
+            self._focal_key = key
+
+        self._set_parameters({
+            "inputPoint0": self._focal_points[0],
+            "inputPoint1": self._focal_points[1],
+            "inputRadius": self.intensity,
+            "inputSaturation": self.focal_region_saturation,
+        })
+
+@_inputs(inputRadius="radius")
 class DiscBlur(Filter):
     """A blur effect that uses a disc-shaped convolution kernel.
 
@@ -232,13 +365,10 @@ class DiscBlur(Filter):
     .. versionadded:: 0.0.2
     """
     def __init__(self, radius: float = 8.0):
-        super().__init__("CIBoxBlur")
+        super().__init__("CIDiscBlur")
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
+@_inputs(inputIntensity="intensity")
 class Edges(Filter):
     """Detects the edges in the image and highlights them colorfully, blackening other areas of the image.
 
@@ -251,10 +381,7 @@ class Edges(Filter):
         super().__init__("CIEdges")
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
-
+@_inputs(inputRadius="radius")
 class EdgeWork(Filter):
     """A filter which produces a stylized black-and-white rendition of an image that looks similar to a woodblock cutout.
 
@@ -267,10 +394,6 @@ class EdgeWork(Filter):
         super().__init__("CIEdgeWork")
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
 class Fade(Filter):
     """A "Fade" style effect filter.
 
@@ -279,6 +402,40 @@ class Fade(Filter):
     def __init__(self):
         super().__init__("CIPhotoEffectFade")
 
+class FilterChain(Filter):
+    """A sequence of filters applied as one. The whole sequence is rendered in a single Core Image pass, so no intermediate images are produced between the filters.
+
+    :param filters: The filters to apply, in order
+    :type filters: Filter
+
+    :Example:
+
+    >>> from macimg.filters import Bloom, FilterChain, GaussianBlur, Sepia
+    >>> dreamy = FilterChain(Bloom(), GaussianBlur(4), Sepia())
+    >>> dreamy.apply_to(image)
+
+    .. versionadded:: 0.0.4
+    """
+    def __init__(self, *filters: Filter):
+        self.filters = list(filters)
+
+    @property
+    def _high_precision(self) -> bool:
+        return any(filter._high_precision for filter in self.filters)
+
+    def _signature(self) -> Union[tuple, None]:
+        signatures = tuple(filter._signature() for filter in self.filters)
+        if None in signatures:
+            return None
+        return (type(self), signatures)
+
+    def _flattened(self) -> list[Filter]:
+        return [member for filter in self.filters for member in filter._flattened()]
+
+    def _cifilters_for(self, image: Image) -> list['Quartz.CIFilter']:
+        return [cifilter for filter in self.filters for cifilter in filter._cifilters_for(image)]
+
+@_inputs(inputRadius="intensity")
 class GaussianBlur(Filter):
     """Blurs the image using a Gaussian filter.
 
@@ -287,14 +444,13 @@ class GaussianBlur(Filter):
 
     .. versionadded:: 0.0.1
     """
+    _high_precision = True
+
     def __init__(self, intensity: float = 10):
         super().__init__("CIGaussianBlur")
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputRadius")
-        return super().apply_to(image)
-
+@_inputs(inputIntensity="intensity", inputRadius="radius")
 class Gloom(Filter):
     """A filter which fulls the highlights of an image.
 
@@ -305,16 +461,14 @@ class Gloom(Filter):
 
     .. versionadded:: 0.0.2
     """
+    _high_precision = True
+
     def __init__(self, intensity: float = 0.5, radius: float = 10.0):
         super().__init__("CIGloom")
         self.intensity = intensity
         self.radius = radius
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputScale="pixel_size")
 class HexagonalPixellate(Filter):
     """A filter which pixellates an image by rendering areas as hexagons whose color is an average of the area's pixels.
 
@@ -330,16 +484,6 @@ class HexagonalPixellate(Filter):
         self.pixel_size = pixel_size
         self.center = center
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.pixel_size, "inputScale")
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        return super().apply_to(image)
-
 class Instant(Filter):
     """A "Instant" style effect filter.
 
@@ -356,26 +500,31 @@ class Invert(Filter):
     def __init__(self):
         super().__init__("CIColorInvert")
 
+@_inputs(inputNRNoiseLevel="noise_level", inputNRSharpness="sharpness", inputEdgeIntensity="edge_intensity", inputThreshold="threshold", inputContrast="contrast")
 class LineOverlay(Filter):
-    """A filter which produces a stylized black-and-white rendition of an image that looks similar to a woodblock cutout.
-
-    :param radius: The thickness of the edges, defaults to 3.0
-    :type radius: float, optional
+    """A filter which outlines the edges of an image in black, leaving the rest transparent, similar to a sketch.
+
+    :param noise_level: The threshold for luminance changes that are considered noise and smoothed over before edges are detected, defaults to 0.07
+    :type noise_level: float, optional
+    :param sharpness: The sharpness applied while reducing noise, defaults to 0.71
+    :type sharpness: float, optional
+    :param edge_intensity: The degree to which edges are emphasized before thresholding, defaults to 1.0
+    :type edge_intensity: float, optional
+    :param threshold: The threshold separating edge and non-edge pixels, defaults to 1.0
+    :type threshold: float, optional
+    :param contrast: The contrast used to strengthen the drawn lines, defaults to 50.0
+    :type contrast: float, optional
 
     .. versionadded:: 0.0.1
     """
     def __init__(self, noise_level: float = 0.07, sharpness: float = 0.71, edge_intensity: float = 1.00, threshold: float = 1.0, contrast: float = 50.0):
         super().__init__("CILineOverlay")
         self.noise_level = noise_level
+        self.sharpness = sharpness
         self.edge_intensity = edge_intensity
         self.threshold = threshold
         self.contrast = contrast
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.noise_level, "inputNRNoiseLevel")
-        self._cifilter.setValue_forKey_(self.threshold, "inputThreshold")
-        return super().apply_to(image)
-
 class Median(Filter):
     """A noise reduction effect that replaces pixel values with the median pixel value among their neighboring pixels.
 
@@ -407,12 +556,13 @@ class Monochrome(Filter):
         self.color = color
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        cicolor = Quartz.CIColor.alloc().initWithColor_(self.color._nscolor)
-        self._cifilter.setValue_forKey_(cicolor, "inputColor")
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
+    def _prepare(self, image: Image):
+        self._set_parameters({
+            "inputColor": _cicolor(self.color._rgba()),
+            "inputIntensity": self.intensity,
+        })
 
+@_inputs(inputRadius="radius", inputAngle="angle")
 class MotionBlur(Filter):
     """A blur effect which simulates a camera moving at a specified angle and image while capturing an image.
 
@@ -428,11 +578,6 @@ class MotionBlur(Filter):
         self.radius = radius
         self.angle = angle
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        self._cifilter.setValue_forKey_(self.angle, "inputAngle")
-        return super().apply_to(image)
-
 class Noir(Filter):
     """A "Noir" style effect filter.
 
@@ -441,6 +586,7 @@ class Noir(Filter):
     def __init__(self):
         super().__init__("CIPhotoEffectNoir")
 
+@_inputs(inputNoiseLevel="noise_level", inputSharpness="sharpness")
 class NoiseReduction(Filter):
     """Reduces noise in the image by sharpening areas with a luminance delta below the specified noise level threshold.
 
@@ -451,16 +597,14 @@ class NoiseReduction(Filter):
 
     .. versionadded:: 0.0.1
     """
+    _high_precision = True
+
     def __init__(self, noise_level: float = 0.02, sharpness: float = 0.4):
         super().__init__("CINoiseReduction")
         self.noise_level = noise_level
         self.sharpness = sharpness
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.noise_level, "inputNoiseLevel")
-        self._cifilter.setValue_forKey_(self.sharpness, "inputSharpness")
-        return super().apply_to(image)
-
+@_inputs(inputThreshold="threshold")
 class Outline(Filter):
     """Outlines detected edges within the image in black, leaving the rest transparent.
 
@@ -473,10 +617,7 @@ class Outline(Filter):
         super().__init__("CILineOverlay")
         self.threshold = threshold
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.threshold, "inputThreshold")
-        return super().apply_to(image)
-
+@_inputs(inputScale="pixel_size")
 class Pixellate(Filter):
     """Pixellates the image.
 
@@ -489,10 +630,7 @@ class Pixellate(Filter):
         super().__init__("CIPixellate")
         self.pixel_size = pixel_size
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.pixel_size, "inputScale")
-        return super().apply_to(image)
-
+@_inputs(inputRadius="point_size")
 class Pointillize(Filter):
     """Applies a pointillization filter to the image.
 
@@ -505,10 +643,6 @@ class Pointillize(Filter):
         super().__init__("CIPointillize")
         self.point_size = point_size
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.point_size, "inputRadius")
-        return super().apply_to(image)
-
 class Process(Filter):
     """A "Process" style effect filter.
 
@@ -517,6 +651,7 @@ class Process(Filter):
     def __init__(self):
         super().__init__("CIPhotoEffectProcess")
 
+@_inputs(inputIntensity="intensity")
 class Sepia(Filter):
     """Applies a sepia filter to the image; maps all colors of the image to shades of brown.
 
@@ -529,10 +664,6 @@ class Sepia(Filter):
         super().__init__("CISepiaTone")
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
-
 class Thermal(Filter):
     """A "Thermal" style effect filter.
 
@@ -557,6 +688,7 @@ class Transfer(Filter):
     def __init__(self):
         super().__init__("CIPhotoEffectTransfer")
 
+@_inputs(inputIntensity="intensity")
 class Vignette(Filter):
     """Applies vignette shading to the corners of the image.
 
@@ -569,10 +701,7 @@ class Vignette(Filter):
         super().__init__("CIVignette")
         self.intensity = intensity
 
-    def apply_to(self, image: Image) -> Image:
-        self._cifilter.setValue_forKey_(self.intensity, "inputIntensity")
-        return super().apply_to(image)
-
+@_inputs(centered=True, inputAmount="amount")
 class ZoomBlur(Filter):
     """A blur effect which simulates zooming a camera while capturing an image.
 
@@ -584,20 +713,10 @@ class ZoomBlur(Filter):
     .. versionadded:: 0.0.2
     """
     def __init__(self, amount: float = 20.0, center: Union[tuple[int, int], None] = None):
-        super().__init__("CIMotionBlur")
+        super().__init__("CIZoomBlur")
         self.amount = amount
         self.center = center
 
-    def apply_to(self, image: Image) -> Image:
-        if self.center is None:
-            self.center = Quartz.CIVector.vectorWithX_Y_(image.size[0] / 2, image.size[1] / 2)
-        else:
-            self.center = Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1])
-
-        self._cifilter.setValue_forKey_(self.amount, "inputAmount")
-        self._cifilter.setValue_forKey_(self.center, "inputCenter")
-        return super().apply_to(image)
-
 class XRay(Filter):
     """An X-Ray style effect filter.
 
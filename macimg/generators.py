@@ -3,24 +3,48 @@ import os
 
 import AppKit
 import Quartz
+import objc
 
-from .core import Color, Image
+from .core import Color, Image, _NSMakeRect, _cicolor, _civector, _kCIOutputImageKey, _render_ciimage
+
+# The number of distinct outputs each generator keeps for reuse
+_CACHED_OUTPUTS = 8
+
+# Marks a QR code generator that hasn't encoded an image yet
+_NO_MESSAGE = object()
 
 class ImageGenerator:
+    # Whether the same inputs always produce the same image, so that outputs can be reused
+    _deterministic = True
+
     def __init__(self, filter_name):
         self._cifilter = Quartz.CIFilter.filterWithName_(filter_name)
         self._cifilter.setDefaults()
         self._size = None
+        self._outputs: dict[tuple, 'AppKit.NSImage'] = {}
 
     def generate(self) -> Image:
-        img =  self._cifilter.valueForKey_(Quartz.kCIOutputImageKey)
-        if self._size is not None:
-            img = img.imageByCroppingToRect_(AppKit.NSMakeRect(0, 0, *self._size))
-
-        rep = AppKit.NSCIImageRep.imageRepWithCIImage_(img)
-        result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-        result.addRepresentation_(rep)
-        return Image(result)
+        return self._generate({})
+
+    def _generate(self, inputs: dict) -> Image:
+        # Outputs for the last few distinct inputs and sizes are kept, so generating the same image again (e.g. for tiling) skips Core Image entirely
+        key = (tuple(inputs.items()), self._size)
+        nsimage = self._outputs.get(key) if self._deterministic else None
+        if nsimage is None:
+            with objc.autorelease_pool():
+                self._cifilter.setValuesForKeysWithDictionary_(inputs)
+                img = self._cifilter.valueForKey_(_kCIOutputImageKey)
+                if self._size is not None:
+                    img = img.imageByCroppingToRect_(_NSMakeRect(0, 0, *self._size))
+
+                # Render once through the shared context instead of wrapping the output in an NSCIImageRep that re-renders on every draw
+                nsimage = _render_ciimage(img, img.extent())
+
+            if self._deterministic:
+                self._outputs[key] = nsimage
+                if len(self._outputs) > _CACHED_OUTPUTS:
+                    del self._outputs[next(iter(self._outputs))]
+        return Image(nsimage)
 
 class CheckerboardGenerator(ImageGenerator):
     def __init__(self, color1: Color = Color.white(), color2: Color = Color.black(), square_width: int = 10, sharpness: float = 1.0, center: tuple[int, int] = (0, 0)):
@@ -32,22 +56,35 @@ class CheckerboardGenerator(ImageGenerator):
         super().__init__("CICheckerboardGenerator")
 
     def generate(self, width: int, height: int):
-        self._size = AppKit.NSMakeSize(width, height)
-        self._cifilter.setValue_forKey_(Quartz.CIColor.alloc().initWithColor_(self.color1._nscolor), "inputColor0")
-        self._cifilter.setValue_forKey_(Quartz.CIColor.alloc().initWithColor_(self.color2._nscolor), "inputColor1")
-        self._cifilter.setValue_forKey_(self.square_width, "inputWidth")
-        self._cifilter.setValue_forKey_(self.sharpness, "inputSharpness")
-        self._cifilter.setValue_forKey_(Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1]), "inputCenter")
-        return super().generate()
+        self._size = (width, height)
+        return self._generate({
+            "inputColor0": _cicolor(self.color1._rgba()),
+            "inputColor1": _cicolor(self.color2._rgba()),
+            "inputWidth": self.square_width,
+            "inputSharpness": self.sharpness,
+            "inputCenter": _civector(*self.center),
+        })
 
 class QRCodeGenerator(ImageGenerator):
+    """Generates a QR code encoding some content.
+
+    :param content: The content to encode: a path to a file, whose data is encoded; any other string, which is encoded as UTF-8 text; or an image, which is encoded as PNG data (versions before 0.0.4 encoded images as TIFF data)
+    :type content: Any
+    :param correction_level: The level of error correction to use, defaults to "M"
+    :type correction_level: Literal["L", "M", "Q", "H"]
+    :raises ValueError: If the content is an image that has no pixel data
+
+    .. versionadded:: 0.0.1
+    """
     def __init__(self, content: Any, correction_level: Literal["L", "M", "Q", "H"] = "M"):
         self.content = content
         self.correction_level = correction_level
+        self._image_message = None
+        self._image_message_key = _NO_MESSAGE
         super().__init__("CIQRCodeGenerator")
 
     def generate(self):
-        self._size = AppKit.NSMakeSize(100, 100)
+        self._size = (100, 100)
 
         if isinstance(self.content, str) and os.path.exists(self.content):
             data = AppKit.NSData.dataWithContentsOfFile_(self.content)
@@ -56,20 +93,31 @@ class QRCodeGenerator(ImageGenerator):
             data = AppKit.NSString.alloc().initWithString_(self.content).dataUsingEncoding_(AppKit.NSUTF8StringEncoding)
         
         elif isinstance(self.content, Image):
-            data = AppKit.NSData.dataWithData_(self.content._nsimage.TIFFRepresentation())
-
-        self._cifilter.setValue_forKey_(data, "inputMessage")
-        self._cifilter.setValue_forKey_(self.correction_level, "inputCorrectionLevel")
-        image = super().generate()
-        return image
+            # Images are encoded as PNG, which is far smaller and quicker to produce than TIFF, and only re-encoded when their pixels change
+            key = self.content._content_digest()
+            if key is None:
+                raise ValueError("Error: Cannot encode an image that has no pixel data in a QR code.")
+            if key != self._image_message_key:
+                cgimage = self.content._nsimage.CGImageForProposedRect_context_hints_(None, None, None)[0]
+                rep = AppKit.NSBitmapImageRep.alloc().initWithCGImage_(cgimage)
+                self._image_message = rep.representationUsingType_properties_(AppKit.NSBitmapImageFileTypePNG, {})
+                self._image_message_key = key
+            data = self._image_message
+
+        return self._generate({
+            "inputMessage": data,
+            "inputCorrectionLevel": self.correction_level,
+        })
 
 class RandomGenerator(ImageGenerator):
+    _deterministic = False
+
     def __init__(self):
         super().__init__("CIRandomGenerator")
 
     def generate(self, width: int, height: int):
-        self._size = AppKit.NSMakeSize(width, height)
-        return super().generate()
+        self._size = (width, height)
+        return self._generate({})
 
 class StripesGenerator(ImageGenerator):
     def __init__(self, color1: Color = Color.red(), color2: Color = Color.black(), stripe_width: int = 10, sharpness: float = 1.0, center: tuple[int, int] = (0, 0)):
@@ -81,13 +129,14 @@ class StripesGenerator(ImageGenerator):
         super().__init__("CIStripesGenerator")
 
     def generate(self, width: int, height: int):
-        self._size = AppKit.NSMakeSize(width, height)
-        self._cifilter.setValue_forKey_(Quartz.CIColor.alloc().initWithColor_(self.color1._nscolor), "inputColor0")
-        self._cifilter.setValue_forKey_(Quartz.CIColor.alloc().initWithColor_(self.color2._nscolor), "inputColor1")
-        self._cifilter.setValue_forKey_(self.stripe_width, "inputWidth")
-        self._cifilter.setValue_forKey_(self.sharpness, "inputSharpness")
-        self._cifilter.setValue_forKey_(Quartz.CIVector.vectorWithX_Y_(self.center[0], self.center[1]), "inputCenter")
-        return super().generate()
+        self._size = (width, height)
+        return self._generate({
+            "inputColor0": _cicolor(self.color1._rgba()),
+            "inputColor1": _cicolor(self.color2._rgba()),
+            "inputWidth": self.stripe_width,
+            "inputSharpness": self.sharpness,
+            "inputCenter": _civector(*self.center),
+        })
 
 class TextImageGenerator(ImageGenerator):
     def __init__(self, text: str, font_size: float = 12.0, font_name: str = "HelveticaNeue", scale_factor: float = 1.0):
@@ -98,11 +147,12 @@ class TextImageGenerator(ImageGenerator):
         super().__init__("CITextImageGenerator")
 
     def generate(self) -> Image:
-        self._cifilter.setValue_forKey_(self.text, "inputText")
-        self._cifilter.setValue_forKey_(self.font_size, "inputFontSize")
-        self._cifilter.setValue_forKey_(self.font_name, "inputFontName")
-        self._cifilter.setValue_forKey_(self.scale_factor, "inputScaleFactor")
-        return super().generate()
+        return self._generate({
+            "inputText": self.text,
+            "inputFontSize": self.font_size,
+            "inputFontName": self.font_name,
+            "inputScaleFactor": self.scale_factor,
+        })
     
 class RoundedRectangleGenerator(ImageGenerator):
     def __init__(self, color: Color, width: int, height: int, radius: Union[int, float]):
@@ -113,8 +163,8 @@ class RoundedRectangleGenerator(ImageGenerator):
         super().__init__("CIRoundedRectangleGenerator")
 
     def generate(self) -> Image:
-        extent = AppKit.NSValue.valueWithRect_(AppKit.NSMakeRect(0, 0, self.width, self.height))
-        self._cifilter.setValue_forKey_(Quartz.CIColor.alloc().initWithColor_(self.color._nscolor), "inputColor")
-        self._cifilter.setValue_forKey_(extent, "inputExtent")
-        self._cifilter.setValue_forKey_(self.radius, "inputRadius")
-        return super().generate()
\ No newline at end of file
+        return self._generate({
+            "inputColor": _cicolor(self.color._rgba()),
+            "inputExtent": _civector(0, 0, self.width, self.height),
+            "inputRadius": self.radius,
+        })
\ No newline at end of file
@@ -1,16 +1,37 @@
 from typing import Union, Literal
+import functools
 import math
 
-import AppKit
 import Quartz
-
-from .core import Image
+import objc
+
+from .core import Image, _cached_render, _ciimage, _kCIInputImageKey, _kCIOutputImageKey, _render_ciimage
+from .filters import _prototype
+
+def _lanczos_scale(source: 'Quartz.CIImage', scale_x: float, scale_y: float) -> 'Quartz.CIImage':
+    # Lanczos resampling keeps downscaled images sharper and free of the aliasing an affine transform's bilinear sampling leaves
+    lanczos = _prototype("CILanczosScaleTransform").copy()
+    lanczos.setValuesForKeysWithDictionary_({
+        _kCIInputImageKey: source,
+        "inputScale": scale_y,
+        "inputAspectRatio": scale_x / scale_y,
+    })
+    return lanczos.valueForKey_(_kCIOutputImageKey)
+
+@functools.lru_cache(maxsize=64)
+def _sin_cos(degrees: float) -> tuple[float, float]:
+    # Quarter turns are exact, so that they move whole pixels and produce whole-pixel dimensions
+    quarter_turns, remainder = divmod(degrees, 90)
+    if remainder == 0:
+        return ((0.0, 1.0), (1.0, 0.0), (0.0, -1.0), (-1.0, 0.0))[int(quarter_turns) % 4]
+    radians = math.radians(degrees)
+    return math.sin(radians), math.cos(radians)
+
+_FLIP_ORIENTATIONS = {"horizontal": 2, "vertical": 4}
 
 class Transform:
-    def __init__(self):
-        self._transform = None
-        self._size = None
-        self._bounds = None
+    # Whether the transform is a pure scale that should be resampled with a Lanczos filter rather than applied as an affine transform
+    _resample = False
 
     def apply_to(self, image: Image) -> Image:
         """Applies the transformation to an image.
@@ -22,22 +43,45 @@ class Transform:
 
         .. versionadded:: 0.0.1
         """
-        if self._size is None:
-            result = AppKit.NSImage.alloc().initWithSize_(image._nsimage.size())
+        def render() -> 'AppKit.NSImage':
+            with objc.autorelease_pool():
+                source = _ciimage(nsimage)
+                color_space = source.colorSpace()
+                extent = source.extent()
+                if extent.origin.x != 0 or extent.origin.y != 0:
+                    source = source.imageByApplyingTransform_(Quartz.CGAffineTransformMakeTranslation(-extent.origin.x, -extent.origin.y))
+
+                # The transform is applied by Core Image as part of the render, rather than by drawing into a lockFocus context
+                result, (width, height) = self._transformed(source, extent.size.width, extent.size.height)
+                return _render_ciimage(result, Quartz.CGRectMake(0, 0, width, height), color_space)
+
+        # Applying the same transform to the same unmodified image again reuses the earlier result
+        nsimage = image._nsimage
+        image._nsimage = _cached_render(nsimage, self._signature(), render)
+        image.modified = True
+        return image
+
+    def _geometry(self, width: float, height: float) -> tuple['Quartz.CGAffineTransform', tuple[float, float]]:
+        # Subclasses return the transform to apply to an image of the given pixel dimensions, and the dimensions of the result
+        return Quartz.CGAffineTransformIdentity, (width, height)
+
+    def _transformed(self, source: 'Quartz.CIImage', width: float, height: float) -> tuple['Quartz.CIImage', tuple[float, float]]:
+        # Adds the transform to a CIImage whose extent is (0, 0, width, height), returning the result and its dimensions
+        transform, size = self._geometry(width, height)
+        if self._resample:
+            result = _lanczos_scale(source, transform.a, transform.d)
         else:
-            result = AppKit.NSImage.alloc().initWithSize_(self._size)
+            result = source.imageByApplyingTransform_(transform)
 
-        if self._bounds is None:
-            self._bounds = AppKit.NSMakeRect(0, 0, image.size[0], image.size[1])
+        # Only crops that cut something off are added, so that consecutive affine transforms stay adjacent and Core Image can merge them into one
+        bounds = Quartz.CGRectMake(0, 0, *size)
+        if not Quartz.CGRectContainsRect(bounds, result.extent()):
+            result = result.imageByCroppingToRect_(bounds)
+        return result, size
 
-        result.lockFocus()
-        self._transform.concat()
-        image._nsimage.drawInRect_fromRect_operation_fraction_(self._bounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0)
-        result.unlockFocus()
-        
-        image._nsimage = Image(result)._nsimage
-        image.modified = True
-        return image
+    def _signature(self) -> tuple:
+        # Identifies the transform's effect, so that an identical render can be recognized
+        return (type(self), *vars(self).items())
 
 class Crop(Transform):
     """Crops an image to the specified dimensions.
@@ -50,14 +94,12 @@ class Crop(Transform):
     .. versionadded:: 0.0.2
     """
     def __init__(self, size: tuple[int, int], corner: tuple[int, int] = (0, 0)):
-        super().__init__()
         self.size = size
         self.corner = corner
 
-    def apply_to(self, image: Image):
-        self._size = AppKit.NSMakeSize(*self.size)
-        self._bounds = AppKit.NSMakeRect(self.corner[0], self.corner[1], self.size[0], self.size[1])
-        return super().apply_to(image)
+    def _geometry(self, width: float, height: float) -> tuple['Quartz.CGAffineTransform', tuple[float, float]]:
+        # Moving the corner to the origin leaves the cropped region inside the result's bounds
+        return Quartz.CGAffineTransformMakeTranslation(-self.corner[0], -self.corner[1]), tuple(self.size)
 
 class Flip(Transform):
     """Flips an image horizontally or vertically.
@@ -68,20 +110,19 @@ class Flip(Transform):
     .. versionadded:: 0.0.2
     """
     def __init__(self, direction: Literal["horizontal", "vertical"]):
-        super().__init__()
         self.direction = direction
 
-    def apply_to(self, image: Image):
-        self._transform = AppKit.NSAffineTransform.alloc().init()
-
-        if self.direction == "horizontal":
-            self._transform.translateXBy_yBy_(image.size[0], 0)
-            self._transform.scaleXBy_yBy_(-1, 1)
-        elif self.direction == "vertical":
-            self._transform.translateXBy_yBy_(0, image.size[1])
-            self._transform.scaleXBy_yBy_(1, -1)
+    def _transformed(self, source: 'Quartz.CIImage', width: float, height: float) -> tuple['Quartz.CIImage', tuple[float, float]]:
+        # Flips are EXIF orientations (2 mirrors horizontally, 4 vertically), which Core Image folds into how the image is sampled
+        orientation = _FLIP_ORIENTATIONS.get(self.direction)
+        if orientation is None:
+            return source, (width, height)
 
-        return super().apply_to(image)
+        result = source.imageByApplyingOrientation_(orientation)
+        extent = result.extent()
+        if extent.origin.x != 0 or extent.origin.y != 0:
+            result = result.imageByApplyingTransform_(Quartz.CGAffineTransformMakeTranslation(-extent.origin.x, -extent.origin.y))
+        return result, (width, height)
 
 class Rotate(Transform):
     """Rotates an image clockwise by the specified number of degrees.
@@ -92,23 +133,16 @@ class Rotate(Transform):
     .. versionadded:: 0.0.1
     """
     def __init__(self, degrees: float):
-        super().__init__()
         self.degrees = degrees
 
-    def apply_to(self, image: Image):
-        sin_degrees = abs(math.sin(self.degrees * math.pi / 180.0))
-        cos_degrees = abs(math.cos(self.degrees * math.pi / 180.0))
-
-        self._size = Quartz.CGSizeMake(image.size[1] * sin_degrees + image.size[0] * cos_degrees, image.size[0] * sin_degrees + image.size[1] * cos_degrees)
-
-        self._bounds = AppKit.NSMakeRect((self._size.width - image.size[0]) / 2, (self._size.height - image.size[1]) / 2, image.size[0], image.size[1])
+    def _geometry(self, width: float, height: float) -> tuple['Quartz.CGAffineTransform', tuple[float, float]]:
+        sin, cos = _sin_cos(self.degrees)
+        size = (height * abs(sin) + width * abs(cos), width * abs(sin) + height * abs(cos))
 
-        self._transform = AppKit.NSAffineTransform.alloc().init()
-        self._transform.translateXBy_yBy_(self._size.width / 2, self._size.height / 2)
-        self._transform.rotateByDegrees_(self.degrees)
-        self._transform.translateXBy_yBy_(-self._size.width / 2, -self._size.height / 2)
-
-        return super().apply_to(image)
+        # Rotate about the image's center, then move that center to the center of the enlarged result
+        center_x, center_y = width / 2, height / 2
+        transform = Quartz.CGAffineTransformMake(cos, sin, -sin, cos, size[0] / 2 - (cos * center_x - sin * center_y), size[1] / 2 - (sin * center_x + cos * center_y))
+        return transform, size
 
 class Scale(Transform):
     """Scales an image by the specified horizontal and vertical factors.
@@ -120,18 +154,15 @@ class Scale(Transform):
     
     .. versionadded:: 0.0.1
     """
+    _resample = True
+
     def __init__(self, scale_factor_x: float, scale_factor_y: Union[float, None] = None):
-        super().__init__()
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y or scale_factor_x
 
-    def apply_to(self, image: Image):
-        self._size = AppKit.NSMakeSize(image.size[0] * self.scale_factor_x, image.size[1] * self.scale_factor_y)
-
-        self._transform = AppKit.NSAffineTransform.alloc().init()
-        self._transform.scaleXBy_yBy_(self.scale_factor_x, self.scale_factor_y)
-
-        return super().apply_to(image)
+    def _geometry(self, width: float, height: float) -> tuple['Quartz.CGAffineTransform', tuple[float, float]]:
+        transform = Quartz.CGAffineTransformMakeScale(self.scale_factor_x, self.scale_factor_y)
+        return transform, (width * self.scale_factor_x, height * self.scale_factor_y)
 
 class Resize(Transform):
     """Resizes an image to the specified width and height.
@@ -143,18 +174,39 @@ class Resize(Transform):
     
     .. versionadded:: 0.0.1
     """
+    _resample = True
+
     def __init__(self, width: int, height: Union[int, None] = None):
-        super().__init__()
         self.width = width
         self.height = height
 
-    def apply_to(self, image: Image):
-        if self.height is None:
-            self.height = image.size[1] * self.width / image.size[0]
+    def _geometry(self, width: float, height: float) -> tuple['Quartz.CGAffineTransform', tuple[float, float]]:
+        # A missing height is worked out per image, so that one Resize can keep the proportions of images with different aspect ratios
+        target_height = self.height if self.height is not None else height * self.width / width
+        return Quartz.CGAffineTransformMakeScale(self.width / width, target_height / height), (self.width, target_height)
 
-        self._size = AppKit.NSMakeSize(image.size[0] * self.width / image.size[0], image.size[1] * self.height / image.size[1])
+class TransformChain(Transform):
+    """A sequence of transforms applied as one. The whole sequence is rendered in a single Core Image pass, so no intermediate images are produced between the transforms.
+
+    :param transforms: The transforms to apply, in order
+    :type transforms: Transform
+
+    :Example:
+
+    >>> from macimg.transforms import Flip, Resize, Rotate, TransformChain
+    >>> thumbnail = TransformChain(Rotate(90), Flip("horizontal"), Resize(128))
+    >>> thumbnail.apply_to(image)
+
+    .. versionadded:: 0.0.4
+    """
+    def __init__(self, *transforms: Transform):
+        self.transforms = list(transforms)
 
-        self._transform = AppKit.NSAffineTransform.alloc().init()
-        self._transform.scaleXBy_yBy_(self.width / image.size[0], self.height / image.size[1])
+    def _transformed(self, source: 'Quartz.CIImage', width: float, height: float) -> tuple['Quartz.CIImage', tuple[float, float]]:
+        # The transforms are stacked onto one CIImage, so the whole chain is rendered at once
+        for transform in self.transforms:
+            source, (width, height) = transform._transformed(source, width, height)
+        return source, (width, height)
 
-        return super().apply_to(image)
\ No newline at end of file
+    def _signature(self) -> tuple:
+        return (type(self), *(transform._signature() for transform in self.transforms))